@@ -1,11 +1,19 @@
 import os
+from functools import cached_property, lru_cache
 from typing import Dict, Any, List
 
 try:
+    from pydantic import Field
     from pydantic_settings import BaseSettings
     
     class Settings(BaseSettings):
-        model_config = {"extra": "ignore", "env_file": ".env", "env_prefix": "MCP_", "case_sensitive": False}
+        model_config = {
+            "extra": "ignore",
+            "env_file": ".env",
+            "env_prefix": "MCP_",
+            "case_sensitive": True,
+            "ignored_types": (cached_property,),
+        }
         
         # Server settings
         HOST: str = "0.0.0.0"
@@ -23,16 +31,17 @@ try:
         # Model settings
         STT_MODEL: str = "openai/whisper-base"  # Options: small, medium, large
         #LLM_MODEL: str = "meta-llama/Llama-2-7b-chat-hf"  # Use a Hugging Face model ID
-        OLLAMA_URL: str = os.getenv("OLLAMA_URL", "http://host.docker.internal:11434")
-        LLM_MODEL: str = os.getenv("LLM_MODEL", "qwq:32b")
+        OLLAMA_URL: str = Field(default_factory=lambda: os.getenv("OLLAMA_URL", "http://host.docker.internal:11434"))
+        LLM_MODEL: str = Field(default_factory=lambda: os.getenv("LLM_MODEL", "qwq:32b"))
         TTS_MODEL_DIR: str = os.path.join("./models", "tts")
-        TTS_MODEL: str = os.getenv("TTS_MODEL", "tts_models/en/ljspeech/tacotron2-DDC")
+        TTS_MODEL: str = Field(default_factory=lambda: os.getenv("TTS_MODEL", "tts_models/en/ljspeech/tacotron2-DDC"))
         
         # Processing settings
         MAX_AUDIO_LENGTH_SECONDS: int = 60
         MAX_TOKENS: int = 1024
         TEMPERATURE: float = 0.7
         TOP_P: float = 0.9
+        MAX_HISTORY_TURNS: int = 8  # User/assistant exchanges kept in the prompt
         
         # Feature flags
         GENERATE_AUDIO_RESPONSE: bool = True
@@ -42,19 +51,19 @@ try:
         ENABLED_TOOLS: list = ["weather", "calculator", "document_search", "knowledge_search", "database"]
         
         # Individual tool configs (loaded from env)
-        WEATHER_API_KEY: str = os.getenv("WEATHER_API_KEY", "a32388aba00ba920e2abf48418dc2995")
+        WEATHER_API_KEY: str = Field(default_factory=lambda: os.getenv("WEATHER_API_KEY", "a32388aba00ba920e2abf48418dc2995"))
         WEATHER_DEFAULT_LOCATION: str = "San Francisco"
         
         # RAG tool configs
-        RAG_ENDPOINT: str = os.getenv("RAG_ENDPOINT", "http://localhost:7000")
-        RAG_API_KEY: str = os.getenv("RAG_API_KEY", "")
-        KB_ENDPOINT: str = os.getenv("KB_ENDPOINT", "http://localhost:8000")
-        KB_API_KEY: str = os.getenv("KB_API_KEY", "")
+        RAG_ENDPOINT: str = Field(default_factory=lambda: os.getenv("RAG_ENDPOINT", "http://localhost:7000"))
+        RAG_API_KEY: str = Field(default_factory=lambda: os.getenv("RAG_API_KEY", ""))
+        KB_ENDPOINT: str = Field(default_factory=lambda: os.getenv("KB_ENDPOINT", "http://localhost:8000"))
+        KB_API_KEY: str = Field(default_factory=lambda: os.getenv("KB_API_KEY", ""))
         
         # Database tool configs
-        DATABASE_CONFIG_FILE: str = os.getenv("DATABASE_CONFIG_FILE", "./database_config.json")
+        DATABASE_CONFIG_FILE: str = Field(default_factory=lambda: os.getenv("DATABASE_CONFIG_FILE", "./database_config.json"))
         
-        @property
+        @cached_property
         def TOOL_CONFIGS(self) -> Dict[str, Dict[str, Any]]:
             return {
                 "weather": {
@@ -76,7 +85,7 @@ try:
             }
 except ImportError:
     # Fallback for older pydantic versions
-    from pydantic import BaseSettings
+    from pydantic import BaseSettings, Field
     
     class Settings(BaseSettings):
         # Server settings
@@ -95,16 +104,17 @@ except ImportError:
         # Model settings
         STT_MODEL: str = "openai/whisper-base"  # Options: small, medium, large
         #LLM_MODEL: str = "meta-llama/Llama-2-7b-chat-hf"  # Use a Hugging Face model ID
-        OLLAMA_URL: str = os.getenv("OLLAMA_URL", "http://host.docker.internal:11434")
-        LLM_MODEL: str = os.getenv("LLM_MODEL", "qwq:32b")
+        OLLAMA_URL: str = Field(default_factory=lambda: os.getenv("OLLAMA_URL", "http://host.docker.internal:11434"))
+        LLM_MODEL: str = Field(default_factory=lambda: os.getenv("LLM_MODEL", "qwq:32b"))
         TTS_MODEL_DIR: str = os.path.join(MODEL_DIR, "tts")
-        TTS_MODEL: str = os.getenv("TTS_MODEL", "tts_models/en/ljspeech/tacotron2-DDC")
+        TTS_MODEL: str = Field(default_factory=lambda: os.getenv("TTS_MODEL", "tts_models/en/ljspeech/tacotron2-DDC"))
         
         # Processing settings
         MAX_AUDIO_LENGTH_SECONDS: int = 60
         MAX_TOKENS: int = 1024
         TEMPERATURE: float = 0.7
         TOP_P: float = 0.9
+        MAX_HISTORY_TURNS: int = 8  # User/assistant exchanges kept in the prompt
         
         # Feature flags
         GENERATE_AUDIO_RESPONSE: bool = True
@@ -112,21 +122,47 @@ except ImportError:
         
         # Tool settings
         ENABLED_TOOLS: List[str] = ["weather", "calculator"]
-        TOOL_CONFIGS: Dict[str, Dict[str, Any]] = {
-            "weather": {
-                "api_key": os.getenv("WEATHER_API_KEY", "a32388aba00ba920e2abf48418dc2995"),
-                "default_location": "San Francisco"
-            },
-            "calculator": {}
-        }
+        
+        # Individual tool configs (loaded from env)
+        WEATHER_API_KEY: str = Field(default_factory=lambda: os.getenv("WEATHER_API_KEY", "a32388aba00ba920e2abf48418dc2995"))
+        WEATHER_DEFAULT_LOCATION: str = "San Francisco"
+        
+        @cached_property
+        def TOOL_CONFIGS(self) -> Dict[str, Dict[str, Any]]:
+            return {
+                "weather": {
+                    "api_key": self.WEATHER_API_KEY,
+                    "default_location": self.WEATHER_DEFAULT_LOCATION
+                },
+                "calculator": {}
+            }
         
         class Config:
             env_file = ".env"
             env_prefix = "MCP_"
+            case_sensitive = True
+            keep_untouched = (cached_property,)
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide Settings instance, building it on first use.
+
+    Returns:
+        Cached Settings object
+    """
+    return Settings()
+
+def ensure_dirs(s: Settings) -> None:
+    """
+    Create the cache and model directories. Called once at server startup.
+
+    Args:
+        s: Settings providing the directory paths
+    """
+    os.makedirs(s.CACHE_DIR, exist_ok=True)
+    os.makedirs(s.MODEL_DIR, exist_ok=True)
 
 # Create settings instance
-settings = Settings()
+settings = get_settings()
 
-# Ensure directories exist
-os.makedirs(settings.CACHE_DIR, exist_ok=True)
-os.makedirs(settings.MODEL_DIR, exist_ok=True)
@@ -9,7 +9,7 @@ from typing import Dict, List, Optional, Any, Union
 import logging
 
 # Import our modules - corrected import paths
-from .config import settings
+from .config import settings, ensure_dirs
 from .core.router import RequestRouter
 from .core.session import SessionManager
 from .models.stt import WhisperSTT
@@ -23,6 +23,9 @@ from .utils.auth import verify_token
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("mcp_server")
 
+# Ensure directories exist
+ensure_dirs(settings)
+
 app = FastAPI(title="MCP Server")
 
 # CORS configuration
@@ -51,21 +54,23 @@ from .tools.weather import WeatherTool
 from .tools.calculator import CalculatorTool
 from .tools.document_rag import DocumentRAGTool
 from .tools.knowledge_base import KnowledgeBaseTool
-from .tools import DATABASE_AVAILABLE
+from .tools import database_available
 
+document_rag_tool = DocumentRAGTool()
 router.register_tool("weather", WeatherTool())
 router.register_tool("calculator", CalculatorTool())
-router.register_tool("document_search", DocumentRAGTool())
+router.register_tool("document_search", document_rag_tool)
 router.register_tool("knowledge_search", KnowledgeBaseTool())
 
 # Register database tool if available
-if DATABASE_AVAILABLE:
+if database_available():
     from .tools import DatabaseTool
     # Initialize database tool with config file
     database_tool = DatabaseTool(config_file=settings.DATABASE_CONFIG_FILE)
     router.register_tool("database", database_tool)
     logger.info("Database tool registered successfully")
 else:
+    database_tool = None
     logger.warning("Database tool not available - missing dependencies")
 
 # Models for API request/response
@@ -85,6 +90,27 @@ class AudioTranscriptionRequest(BaseModel):
     session_id: Optional[str] = None
     format: str = "wav"  # Audio format
 
+@app.on_event("startup")
+async def startup_event():
+    """Warm database connections in the background so first queries skip the handshake."""
+    manager = database_tool.manager if database_tool else None
+    if manager:
+        app.state.database_warmup = asyncio.create_task(manager.warmup())
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared client resources on server shutdown."""
+    await llm_service.aclose()
+    await document_rag_tool.aclose()
+    warmup = getattr(app.state, "database_warmup", None)
+    if warmup and not warmup.done():
+        warmup.cancel()
+        await asyncio.gather(warmup, return_exceptions=True)
+    if database_tool:
+        # Closes pools and Snowflake sessions (stopping their keepalive tasks)
+        # and writes rows still waiting in insert buffers
+        await database_tool.disconnect_all()
+
 @app.get("/")
 async def root():
     return {"status": "running", "message": "MCP Server is operational"}
@@ -157,6 +183,40 @@ async def chat_endpoint(request: ChatRequest, token: str = Depends(verify_token)
         audio_response_id=audio_response_id
     )
 
+@app.post("/api/chat/stream")
+async def chat_stream_endpoint(request: ChatRequest, token: str = Depends(verify_token)):
+    """
+    Process a text chat message and stream the response text as it is generated.
+    Tool calls in the request are executed first; tool calls the LLM asks for
+    in its reply are not followed up, so use /api/chat when tools are needed.
+    The session ID is returned in the X-Session-ID header.
+    """
+    from fastapi.responses import StreamingResponse
+    
+    session_id = request.session_id or session_manager.create_session()
+    
+    tool_results = None
+    if request.tool_calls:
+        tool_results = await router.process_tool_calls(request.tool_calls)
+    
+    async def _chunks():
+        try:
+            async for chunk in llm_service.stream_response(
+                message=request.message,
+                session_id=session_id,
+                tool_results=tool_results
+            ):
+                yield chunk
+        except Exception as e:
+            logger.error(f"Error streaming response: {str(e)}")
+            yield f"Error generating response: {str(e)}"
+    
+    return StreamingResponse(
+        _chunks(),
+        media_type="text/plain; charset=utf-8",
+        headers={"X-Session-ID": session_id}
+    )
+
 @app.get("/api/test-tts")
 async def test_tts_endpoint(text: str = "This is a test of the text to speech system.", token: str = Depends(verify_token)):
     """
@@ -371,4 +431,5 @@ async def websocket_endpoint(websocket: WebSocket):
             await websocket.close(code=1011, reason="Server error")
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # "auto" picks uvloop when installed; Windows falls back to the default loop
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True, loop="auto")
\ No newline at end of file
@@ -1,52 +1,15 @@
 # mcp_server/models/ollama_llm.py
 import logging
-import json
 import aiohttp
-from typing import Dict, List, Any, Optional, Union
+import orjson
+from typing import AsyncIterator, Dict, List, Any, Optional, Union
+
+from ..config import settings
 
 logger = logging.getLogger("mcp_server.ollama_llm")
 
-class OllamaLLMService:
-    """
-    Language Model service that uses a local Ollama instance for generating responses.
-    """
-    
-    def __init__(self, model_name: str = "llama2", ollama_url: str = "http://localhost:11434"):
-        """
-        Initialize the Ollama LLM service.
-        
-        Args:
-            model_name: Name of the model to use in Ollama
-            ollama_url: URL of the Ollama API server
-        """
-        self.model_name = model_name
-        self.ollama_url = ollama_url
-        logger.info(f"Initialized Ollama LLM service with model: {model_name}")
-    
-    async def generate_response(self, message: str, 
-                              session_id: str = None,
-                              conversation: List[Dict[str, Any]] = None,
-                              tool_results: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
-        """
-        Generate a response using the Ollama API.
-        
-        Args:
-            message: User message
-            session_id: Session ID
-            conversation: Conversation history (if not provided, will use empty history)
-            tool_results: Results from tool calls
-            
-        Returns:
-            Dict with the generated response
-        """
-        try:
-            # Prepare prompt with conversation context and tool results
-            prompt = self._format_prompt(message, conversation, tool_results)
-            
-            # Call Ollama API
-            async with aiohttp.ClientSession() as session:
-                # Try using system message parameter for better instruction following
-                system_message = """You are an AI assistant with tool access.
+# Instructions sent via Ollama's "system" parameter
+_SYSTEM_MESSAGE = """You are an AI assistant with tool access.
 
 For weather questions: respond with @weather({"location": "CITY"})
 For math questions: respond with @calculator({"expression": "MATH"})
@@ -67,86 +30,12 @@ IRIS DATA:
 - "What's the average petal length?" → @database({"action": "query", "connection_name": "iris_db", "query": "SELECT ROUND(AVG(petal_length), 2) as avg_petal_length FROM iris", "format": "table"}))
 
 No explanations needed, just the tool call."""
-                
-                # Simplified prompt for the user message
-                user_prompt = self._format_user_prompt(message, conversation, tool_results)
-                
-                # Debug logging
-                logger.info(f"System message: {system_message[:200]}...")
-                logger.info(f"User prompt: {user_prompt[:200]}...")
-                
-                async with session.post(
-                    f"{self.ollama_url}/api/generate",
-                    json={
-                        "model": self.model_name,
-                        "prompt": user_prompt,
-                        "system": system_message,
-                        "stream": False,
-                        "options": {
-                            "temperature": 0.7,
-                            "top_p": 0.9,
-                            "max_tokens": 1024
-                        }
-                    }
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Ollama API error: {error_text}")
-                        raise Exception(f"Ollama API error: {response.status}")
-                    
-                    data = await response.json()
-                    
-                    # Extract the generated text
-                    response_text = data.get("response", "")
-                    
-                    logger.info(f"Full LLM response: {response_text}")
-                    logger.info(f"Generated response: {response_text[:50]}...")
-                    
-                    # If conversation history provided, add this exchange
-                    if conversation is None:
-                        conversation = []
-                    
-                    # Add user message
-                    conversation.append({
-                        "role": "user",
-                        "content": message
-                    })
-                    
-                    # Add assistant message
-                    conversation.append({
-                        "role": "assistant",
-                        "content": response_text
-                    })
-                    
-                    return {
-                        "message": response_text,
-                        "conversation": conversation,
-                        "raw_response": response_text  # Keep raw for tool extraction
-                    }
-                    
-        except Exception as e:
-            logger.error(f"Error generating response: {str(e)}")
-            return {
-                "message": f"Error generating response: {str(e)}",
-                "conversation": conversation or []
-            }
-    
-    def _format_prompt(self, message: str, 
-                     conversation: Optional[List[Dict[str, Any]]] = None,
-                     tool_results: Optional[List[Dict[str, Any]]] = None) -> str:
-        """
-        Format the prompt for the Ollama API.
-        
-        Args:
-            message: User message
-            conversation: Conversation history
-            tool_results: Results from tool calls
-            
-        Returns:
-            Formatted prompt string
-        """
-        # Start with a system prompt that includes tool instructions
-        prompt = """You are an AI assistant with access to tools. You MUST use tools when appropriate.
+
+# Pre-serialized system message for the request body
+_SYSTEM_JSON = orjson.dumps(_SYSTEM_MESSAGE)
+
+# Header for the single-prompt format (no system parameter)
+_FORMAT_PROMPT_HEADER = """You are an AI assistant with access to tools. You MUST use tools when appropriate.
 
 IMPORTANT: When users ask about weather, calculations, or Titanic data, you MUST call the appropriate tool using this EXACT format:
 @tool_name({"param": "value"})
@@ -173,20 +62,9 @@ You: "Let me check the database. @database({\"action\": \"query\", \"connection_
 You MUST use tools for weather, math, and Titanic data. Do NOT give generic responses.
 
 """
-        
-        # Add conversation history
-        if conversation:
-            for msg in conversation:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                
-                if role == "user":
-                    prompt += f"User: {content}\n\n"
-                elif role == "assistant":
-                    prompt += f"Assistant: {content}\n\n"
-        else:
-            # Add few-shot examples if no conversation history
-            prompt += """Here are examples of how to respond:
+
+# Few-shot examples used when there is no conversation history
+_FEW_SHOT_EXAMPLES = """Here are examples of how to respond:
 
 User: What's the weather in Paris?
 Assistant: I'll check the weather for you. @weather({"location": "Paris"})
@@ -213,20 +91,223 @@ User: Show me all iris species
 Assistant: I'll get all the iris species. @database({"action": "query", "connection_name": "iris_db", "query": "SELECT DISTINCT species FROM iris", "format": "table"})
 
 """
+
+class OllamaLLMService:
+    """
+    Language Model service that uses a local Ollama instance for generating responses.
+    """
+    
+    def __init__(self, model_name: str = "llama2", ollama_url: str = "http://localhost:11434"):
+        """
+        Initialize the Ollama LLM service.
         
-        # Add tool results if provided
-        if tool_results:
-            prompt += "Tool Results:\n"
-            for result in tool_results:
-                tool_name = result.get("tool_name", "unknown")
-                formatted = result.get("formatted", json.dumps(result.get("result", {}), indent=2))
-                prompt += f"{tool_name} result:\n{formatted}\n\n"
+        Args:
+            model_name: Name of the model to use in Ollama
+            ollama_url: URL of the Ollama API server
+        """
+        self.model_name = model_name
+        self.ollama_url = ollama_url
+        self._session: Optional[aiohttp.ClientSession] = None
         
-        # Add the current message
-        prompt += f"User: {message}\n\nAssistant:"
+        # Generation options are fixed for the service lifetime, so serialize them once
+        self._options = {
+            "temperature": settings.TEMPERATURE,
+            "top_p": settings.TOP_P,
+            "max_tokens": settings.MAX_TOKENS
+        }
+        self._options_json = orjson.dumps(self._options)
+        logger.info(f"Initialized Ollama LLM service with model: {model_name}")
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+        
+        Returns:
+            aiohttp.ClientSession reused across requests
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60)
+            )
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+    
+    async def generate_response(self, message: str, 
+                              session_id: str = None,
+                              conversation: List[Dict[str, Any]] = None,
+                              tool_results: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Generate a response using the Ollama API.
+        
+        Args:
+            message: User message
+            session_id: Session ID
+            conversation: Conversation history (if not provided, will use empty history)
+            tool_results: Results from tool calls
+            
+        Returns:
+            Dict with the generated response
+        """
+        try:
+            # Call Ollama API
+            session = await self._get_session()
+            
+            # Simplified prompt for the user message; instructions go via the system parameter
+            user_prompt = self._format_user_prompt(message, conversation, tool_results)
+            
+            # Debug logging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("System message: %.200s...", _SYSTEM_MESSAGE)
+                logger.debug("User prompt: %.200s...", user_prompt)
+            
+            async with session.post(
+                f"{self.ollama_url}/api/generate",
+                data=self._build_request_body(user_prompt, stream=False),
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Ollama API error: {error_text}")
+                    raise Exception(f"Ollama API error: {response.status}")
+                
+                data = orjson.loads(await response.read())
+                
+                # Extract the generated text
+                response_text = data.get("response", "")
+                
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Full LLM response: %s", response_text)
+                    logger.debug("Generated response: %.50s...", response_text)
+                
+                # If conversation history provided, add this exchange
+                if conversation is None:
+                    conversation = []
+                
+                # Add user message
+                conversation.append({
+                    "role": "user",
+                    "content": message
+                })
+                
+                # Add assistant message
+                conversation.append({
+                    "role": "assistant",
+                    "content": response_text
+                })
+                
+                return {
+                    "message": response_text,
+                    "conversation": conversation,
+                    "raw_response": response_text  # Keep raw for tool extraction
+                }
+                
+        except Exception as e:
+            logger.error(f"Error generating response: {str(e)}")
+            return {
+                "message": f"Error generating response: {str(e)}",
+                "conversation": conversation or []
+            }
+    
+    async def stream_response(self, message: str,
+                              session_id: str = None,
+                              conversation: List[Dict[str, Any]] = None,
+                              tool_results: Optional[List[Dict[str, Any]]] = None) -> AsyncIterator[str]:
+        """
+        Stream a response from the Ollama API, yielding text as it is generated.
+        
+        Args:
+            message: User message
+            session_id: Session ID
+            conversation: Conversation history; the exchange is appended once the stream completes
+            tool_results: Results from tool calls
+            
+        Yields:
+            Chunks of generated text
+        """
+        session = await self._get_session()
+        user_prompt = self._format_user_prompt(message, conversation, tool_results)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("User prompt: %.200s...", user_prompt)
+        
+        chunks = []
+        async with session.post(
+            f"{self.ollama_url}/api/generate",
+            data=self._build_request_body(user_prompt, stream=True),
+            headers={"Content-Type": "application/json"}
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                logger.error(f"Ollama API error: {error_text}")
+                raise Exception(f"Ollama API error: {response.status}")
+            
+            # Ollama streams newline-delimited JSON objects
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                
+                data = orjson.loads(line)
+                chunk = data.get("response", "")
+                if chunk:
+                    chunks.append(chunk)
+                    yield chunk
+                
+                if data.get("done"):
+                    break
+        
+        # Record the exchange once the full response is known
+        if conversation is not None:
+            conversation.append({"role": "user", "content": message})
+            conversation.append({"role": "assistant", "content": "".join(chunks)})
+    
+    def _build_request_body(self, user_prompt: str, stream: bool = False) -> bytes:
+        """
+        Serialize the /api/generate request body.
+        
+        Args:
+            user_prompt: Prompt text for the user turn
+            stream: Whether Ollama should stream the response
+            
+        Returns:
+            JSON-encoded request body
+        """
+        # Splice pre-serialized fragments so only the prompt is encoded per request
+        return b"".join((
+            b'{"model":', orjson.dumps(self.model_name),
+            b',"prompt":', orjson.dumps(user_prompt),
+            b',"system":', _SYSTEM_JSON,
+            b',"stream":', b"true" if stream else b"false",
+            b',"options":', self._options_json,
+            b"}",
+        ))
+    
+    def _format_prompt(self, message: str, 
+                     conversation: Optional[List[Dict[str, Any]]] = None,
+                     tool_results: Optional[List[Dict[str, Any]]] = None) -> str:
+        """
+        Format the prompt for the Ollama API.
+        
+        Args:
+            message: User message
+            conversation: Conversation history
+            tool_results: Results from tool calls
+            
+        Returns:
+            Formatted prompt string
+        """
+        # Start with a system prompt that includes tool instructions, plus
+        # few-shot examples if there is no conversation history
+        header = _FORMAT_PROMPT_HEADER if conversation else _FORMAT_PROMPT_HEADER + _FEW_SHOT_EXAMPLES
+        prompt = header + self._render_tail(message, conversation, tool_results)
         
         # Debug: Log the prompt being sent
-        logger.info(f"Sending prompt to Ollama: {prompt[:500]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending prompt to Ollama: %.500s...", prompt)
         
         return prompt
     
@@ -236,28 +317,46 @@ Assistant: I'll get all the iris species. @database({"action": "query", "connect
         """
         Format just the user prompt without system instructions (for use with system parameter).
         """
-        prompt = ""
+        return self._render_tail(message, conversation, tool_results)
+    
+    def _render_tail(self, message: str,
+                     conversation: Optional[List[Dict[str, Any]]] = None,
+                     tool_results: Optional[List[Dict[str, Any]]] = None) -> str:
+        """
+        Render conversation history, tool results and the current message.
+        
+        Args:
+            message: User message
+            conversation: Conversation history
+            tool_results: Results from tool calls
+            
+        Returns:
+            Prompt text shared by both prompt formats
+        """
+        parts = []
         
-        # Add conversation history
+        # Add conversation history, keeping only the most recent turns
         if conversation:
-            for msg in conversation:
+            for msg in conversation[-settings.MAX_HISTORY_TURNS * 2:]:
                 role = msg.get("role", "user")
                 content = msg.get("content", "")
                 
                 if role == "user":
-                    prompt += f"User: {content}\n\n"
+                    parts.append(f"User: {content}\n\n")
                 elif role == "assistant":
-                    prompt += f"Assistant: {content}\n\n"
+                    parts.append(f"Assistant: {content}\n\n")
         
         # Add tool results if provided
         if tool_results:
-            prompt += "Tool Results:\n"
+            parts.append("Tool Results:\n")
             for result in tool_results:
                 tool_name = result.get("tool_name", "unknown")
-                formatted = result.get("formatted", json.dumps(result.get("result", {}), indent=2))
-                prompt += f"{tool_name} result:\n{formatted}\n\n"
+                formatted = result.get("formatted")
+                if formatted is None:
+                    formatted = orjson.dumps(result.get("result", {}), option=orjson.OPT_INDENT_2).decode()
+                parts.append(f"{tool_name} result:\n{formatted}\n\n")
         
         # Add the current message
-        prompt += f"User: {message}\n\nAssistant:"
+        parts.append(f"User: {message}\n\nAssistant:")
         
-        return prompt
\ No newline at end of file
+        return "".join(parts)
@@ -1,23 +1,43 @@
 """Tool integration framework for extending LLM capabilities."""
 
+import importlib
+from functools import lru_cache
+
 from .base import BaseTool
 from .weather import WeatherTool
 from .calculator import CalculatorTool
 
-# Try to import DatabaseTool, but handle gracefully if dependencies are missing
-try:
-    from .database import DatabaseTool
-    DATABASE_AVAILABLE = True
-except ImportError as e:
-    print(f"Database functionality not available: {e}")
-    DATABASE_AVAILABLE = False
-    DatabaseTool = None
-except Exception as e:
-    print(f"Database functionality not available: {e}")
-    DATABASE_AVAILABLE = False
-    DatabaseTool = None
-
-if DATABASE_AVAILABLE:
-    __all__ = ["BaseTool", "WeatherTool", "CalculatorTool", "DatabaseTool"]
-else:
-    __all__ = ["BaseTool", "WeatherTool", "CalculatorTool"]
\ No newline at end of file
+
+@lru_cache(maxsize=1)
+def database_available() -> bool:
+    """
+    Check whether the database tool and its dependencies can be imported.
+    The import is attempted once and the result cached; any exception raised
+    while importing counts as unavailable.
+    
+    Returns:
+        True if DatabaseTool is importable
+    """
+    try:
+        importlib.import_module(".database", __name__)
+        return True
+    except Exception as e:
+        # Any import-time failure (not only missing drivers) disables the tool
+        print(f"Database functionality not available: {e}")
+        return False
+
+
+def __getattr__(name):
+    # Defer the database import (and its driver dependencies) until first use
+    if name == "DatabaseTool":
+        if not database_available():
+            return None
+        from .database import DatabaseTool
+        globals()["DatabaseTool"] = DatabaseTool
+        return DatabaseTool
+    if name == "DATABASE_AVAILABLE":
+        return database_available()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["BaseTool", "WeatherTool", "CalculatorTool", "DatabaseTool", "database_available"]
@@ -13,6 +13,8 @@ class BaseTool(abc.ABC):
     or perform specialized operations like calculations, data retrieval, etc.
     """
     
+    __slots__ = ('name', 'description')
+    
     def __init__(self, name: str = None, description: str = None):
         """
         Initialize a tool with a name and description.
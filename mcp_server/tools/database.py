@@ -5,6 +5,7 @@ Integrates all database functionality into a single tool interface.
 
 from typing import Dict, Any, List, Optional
 import logging
+import orjson
 
 from .base import BaseTool
 from .db_tools.config import DatabaseConfigTool
@@ -12,12 +13,76 @@ from .db_tools.manager import DatabaseManagerTool
 
 logger = logging.getLogger("mcp_server.tools.database")
 
+# Static sub-schemas shared by every parameters build. They are plain dicts so
+# manifests stay JSON-serializable; treat them as read-only.
+_LIMIT_SCHEMA = {
+    "type": "integer",
+    "description": "Maximum number of rows to return",
+    "default": 100,
+    "minimum": 1,
+    "maximum": 10000
+}
+
+_FORMAT_SCHEMA = {
+    "type": "string",
+    "enum": ["json", "table", "csv"],
+    "description": "Output format for query results",
+    "default": "table"
+}
+
+_TIMEOUT_SCHEMA = {
+    "type": "integer",
+    "description": "Query timeout in seconds",
+    "default": 30,
+    "minimum": 1,
+    "maximum": 300
+}
+
+_QUERIES_SCHEMA = {
+    "type": "array",
+    "description": "Multiple queries for cross-database action",
+    "items": {
+        "type": "object",
+        "properties": {
+            "connection_name": {"type": "string"},
+            "query": {"type": "string"},
+            "limit": {"type": "integer"},
+            "format": {"type": "string"}
+        },
+        "required": ["connection_name", "query"]
+    }
+}
+
+_LEVEL_SCHEMA = {
+    "type": "integer",
+    "enum": [1, 2, 3],
+    "description": "Schema detail for get_schema_info: 1 schema names, 2 adds tables and views, "
+                   "3 adds columns and row counts (slow on large databases)",
+    "default": 2
+}
+
+_COMBINE_RESULTS_SCHEMA = {
+    "type": "boolean",
+    "description": "Whether to combine results from multiple queries",
+    "default": False
+}
+
 class DatabaseTool(BaseTool):
     """
     Main database tool that provides unified access to all database functionality.
     Combines configuration management and query execution.
     """
     
+    # Maps action names to the coroutine methods that handle them
+    _ACTIONS = {
+        "query": "_execute_query",
+        "list_connections": "_list_connections",
+        "test_connections": "_test_connections",
+        "get_schema_info": "_get_schema_info",
+        "get_table_info": "_get_table_info",
+        "cross_database_query": "_cross_database_query"
+    }
+    
     def __init__(self, config_file: str = None, database_configs: Dict[str, Dict[str, Any]] = None):
         """
         Initialize main database tool.
@@ -34,6 +99,14 @@ class DatabaseTool(BaseTool):
         self.config_tool = None
         self.manager = None
         
+        # Parameters schema cache, keyed on the available connection names
+        self._params_cache = None
+        self._params_cache_key = None
+        
+        # Connection metadata cache, keyed on the manager registry version
+        self._conn_cache = {}
+        self._conn_version = None
+        
         # Try to initialize configuration and manager tools
         try:
             # Initialize configuration tool
@@ -56,6 +129,21 @@ class DatabaseTool(BaseTool):
     @property
     def parameters(self) -> Dict[str, Any]:
         """Define parameters for the main database tool."""
+        key = tuple(self._connection_metadata()["names"]) if self.manager else None
+        if self._params_cache is not None and key == self._params_cache_key:
+            return self._params_cache
+        
+        self._params_cache = self._build_parameters()
+        self._params_cache_key = key
+        return self._params_cache
+    
+    def _invalidate_parameters(self) -> None:
+        """Drop the cached parameters schema."""
+        self._params_cache = None
+        self._params_cache_key = None
+    
+    def _build_parameters(self) -> Dict[str, Any]:
+        """Build the parameters schema for the current connections."""
         if not self.manager:
             # If no manager, only allow config operations
             return {
@@ -109,45 +197,12 @@ class DatabaseTool(BaseTool):
                     "type": "string",
                     "description": "Schema name (optional)"
                 },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of rows to return",
-                    "default": 100,
-                    "minimum": 1,
-                    "maximum": 10000
-                },
-                "format": {
-                    "type": "string",
-                    "enum": ["json", "table", "csv"],
-                    "description": "Output format for query results",
-                    "default": "table"
-                },
-                "timeout": {
-                    "type": "integer",
-                    "description": "Query timeout in seconds",
-                    "default": 30,
-                    "minimum": 1,
-                    "maximum": 300
-                },
-                "queries": {
-                    "type": "array",
-                    "description": "Multiple queries for cross-database action",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "connection_name": {"type": "string"},
-                            "query": {"type": "string"},
-                            "limit": {"type": "integer"},
-                            "format": {"type": "string"}
-                        },
-                        "required": ["connection_name", "query"]
-                    }
-                },
-                "combine_results": {
-                    "type": "boolean",
-                    "description": "Whether to combine results from multiple queries",
-                    "default": False
-                }
+                "level": _LEVEL_SCHEMA,
+                "limit": _LIMIT_SCHEMA,
+                "format": _FORMAT_SCHEMA,
+                "timeout": _TIMEOUT_SCHEMA,
+                "queries": _QUERIES_SCHEMA,
+                "combine_results": _COMBINE_RESULTS_SCHEMA
             },
             "required": ["action"]
         }
@@ -164,26 +219,11 @@ class DatabaseTool(BaseTool):
             Dict with action results
         """
         try:
-            if action == "query":
-                return await self._execute_query(**kwargs)
-            
-            elif action == "list_connections":
-                return await self._list_connections()
-            
-            elif action == "test_connections":
-                return await self._test_connections()
-            
-            elif action == "get_schema_info":
-                return await self._get_schema_info(**kwargs)
-            
-            elif action == "get_table_info":
-                return await self._get_table_info(**kwargs)
-            
-            elif action == "cross_database_query":
-                return await self._cross_database_query(**kwargs)
-            
-            else:
+            method_name = self._ACTIONS.get(action)
+            if method_name is None:
                 raise ValueError(f"Unknown action: {action}")
+            
+            return await getattr(self, method_name)(**kwargs)
                 
         except Exception as e:
             logger.error(f"Database action '{action}' failed: {str(e)}")
@@ -204,7 +244,7 @@ class DatabaseTool(BaseTool):
             connection_name, query, limit, format, timeout, **kwargs
         )
     
-    async def _list_connections(self) -> Dict[str, Any]:
+    async def _list_connections(self, **kwargs) -> Dict[str, Any]:
         """List all available database connections."""
         if self.config_tool:
             return self.config_tool._list_connections()
@@ -216,7 +256,7 @@ class DatabaseTool(BaseTool):
                 "message": "No database configurations available"
             }
     
-    async def _test_connections(self) -> Dict[str, Any]:
+    async def _test_connections(self, **kwargs) -> Dict[str, Any]:
         """Test all database connections."""
         if not self.manager:
             return {
@@ -226,12 +266,12 @@ class DatabaseTool(BaseTool):
         
         return await self.manager.test_all_connections()
     
-    async def _get_schema_info(self, connection_name: str = None) -> Dict[str, Any]:
+    async def _get_schema_info(self, connection_name: str = None, level: int = 2) -> Dict[str, Any]:
         """Get schema information for a database connection."""
         if not self.manager:
             raise ValueError("No database manager available. Check configurations.")
         
-        return await self.manager.get_connection_info(connection_name)
+        return await self.manager.get_connection_info(connection_name, level)
     
     async def _get_table_info(self, connection_name: str, table_name: str, 
                             schema_name: str = None) -> Dict[str, Any]:
@@ -264,20 +304,30 @@ class DatabaseTool(BaseTool):
         
         # Default formatting
         else:
-            import json
-            return json.dumps(result, indent=2)
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+    
+    def _connection_metadata(self) -> Dict[str, Any]:
+        """Return cached connection names and types, rebuilding when the manager changes."""
+        version = (id(self.manager), self.manager.version)
+        if self._conn_version != version:
+            self._conn_cache = {
+                "names": self.manager.get_available_connections(),
+                "types": self.manager.get_connection_types()
+            }
+            self._conn_version = version
+        return self._conn_cache
     
     def get_available_connections(self) -> List[str]:
         """Get list of available database connections."""
         if self.manager:
-            return self.manager.get_available_connections()
+            return list(self._connection_metadata()["names"])
         else:
             return []
     
     def get_connection_types(self) -> Dict[str, str]:
         """Get mapping of connection names to their database types."""
         if self.manager:
-            return self.manager.get_connection_types()
+            return dict(self._connection_metadata()["types"])
         else:
             return {}
     
@@ -285,3 +335,4 @@ class DatabaseTool(BaseTool):
         """Disconnect all database connections."""
         if self.manager:
             await self.manager.disconnect_all()
+        self._invalidate_parameters()
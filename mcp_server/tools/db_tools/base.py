@@ -5,16 +5,62 @@ Provides a foundation for various database connection types.
 
 import abc
 import asyncio
-from typing import Dict, Any, List, Optional, Union, Tuple
+import importlib.util
+import re
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, Any, List, Optional, Union, Tuple
 import logging
-import json
-from datetime import datetime
+import csv
+import io
+import orjson
+from collections import OrderedDict
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 
+try:
+    import sqlglot
+    import sqlglot.errors
+    SQLGLOT_AVAILABLE = True
+except ImportError:
+    SQLGLOT_AVAILABLE = False
+
+# Arrow fast paths are enabled when pyarrow is installed; backends import it themselves
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
 from ..base import BaseTool
 
 logger = logging.getLogger("mcp_server.tools.database")
 
+# Compiled once so validation is a single scan over the raw query
+_FORBIDDEN_RE = re.compile(
+    r'(?is)\b(DROP|DELETE|TRUNCATE|INSERT|UPDATE|CREATE|ALTER|GRANT|REVOKE|'
+    r'EXEC(?:UTE)?|CALL|MERGE|UPSERT)\b'
+)
+_ALLOWED_PREFIX_RE = re.compile(r'(?is)^\s*(?:SELECT|WITH)\b')
+# Fallback LIMIT detection when sqlglot is unavailable: comments and quoted
+# text are blanked out first so they can't hide or fake a LIMIT clause
+_COMMENT_OR_QUOTED_RE = re.compile(
+    r"--[^\n]*|/\*.*?\*/|'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"", re.S
+)
+_LIMIT_RE = re.compile(r'(?i)\bLIMIT\s+(?:\d|ALL\b|[:?$%])')
+
+# database_type -> sqlglot dialect name
+_SQLGLOT_DIALECTS = {
+    'postgresql': 'postgres',
+    'mysql': 'mysql',
+    'sqlite': 'sqlite',
+    'snowflake': 'snowflake'
+}
+
+@lru_cache(maxsize=512)
+def _parse_sql(query: str, dialect: Optional[str]):
+    """Parse a query once per (query, dialect); returns None if sqlglot can't parse it."""
+    try:
+        return sqlglot.parse_one(query, read=dialect)
+    except sqlglot.errors.SqlglotError:
+        return None
+
 class DatabaseConnectionError(Exception):
     """Raised when database connection fails"""
     pass
@@ -29,6 +75,47 @@ class BaseDatabaseTool(BaseTool):
     Provides common functionality for database connections and queries.
     """
     
+    __slots__ = (
+        'connection_params', 'connection', '_is_connected', '_connect_lock',
+        '_prepared_queries', '_schema_cache', '_schema_ttl', '_schema_lock',
+        '_meta_cache', '_meta_ttl'
+    )
+    
+    # Distinct (query, limit) pairs kept by _prepare_query
+    PREPARED_QUERY_CACHE_SIZE = 256
+    
+    # Built once; treat as read-only
+    _PARAMETERS: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "SQL query to execute"
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of rows to return",
+                "default": 100,
+                "minimum": 1,
+                "maximum": 10000
+            },
+            "format": {
+                "type": "string",
+                "enum": ["json", "table", "csv"],
+                "description": "Output format for query results",
+                "default": "table"
+            },
+            "timeout": {
+                "type": "integer",
+                "description": "Query timeout in seconds",
+                "default": 30,
+                "minimum": 1,
+                "maximum": 300
+            }
+        },
+        "required": ["query"]
+    }
+    
     def __init__(self, name: str, description: str, connection_params: Dict[str, Any]):
         """
         Initialize database tool.
@@ -42,41 +129,74 @@ class BaseDatabaseTool(BaseTool):
         self.connection_params = connection_params
         self.connection = None
         self._is_connected = False
+        # Created lazily so it binds to the running event loop
+        self._connect_lock: Optional[asyncio.Lock] = None
+        # (query, limit) -> validated, limited SQL
+        self._prepared_queries: "OrderedDict[Tuple[str, int], str]" = OrderedDict()
+        # level -> (monotonic expiry, schema info) from get_schema_info
+        self._schema_cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+        self._schema_ttl = float(connection_params.get('schema_cache_ttl', 300))
+        self._schema_lock: Optional[asyncio.Lock] = None
+        # e.g. "table:<schema>.<table>" -> (monotonic expiry, value)
+        self._meta_cache: Dict[str, Tuple[float, Any]] = {}
+        self._meta_ttl = float(connection_params.get('metadata_cache_ttl', 60))
         
     @property
     def parameters(self) -> Dict[str, Any]:
         """Define common parameters for database tools."""
+        return self._PARAMETERS
+    
+    @property
+    def pool_config(self) -> Dict[str, Any]:
+        """
+        Connection pool sizing taken from connection_params.
+        
+        Returns:
+            Dict with min_size, max_size and pool_timeout (seconds)
+        """
+        params = self.connection_params
+        max_size = int(params.get('max_size', params.get('max_connections', params.get('pool_size', 5))))
+        min_size = int(params.get('min_size', params.get('min_connections', 1)))
         return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "SQL query to execute"
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of rows to return",
-                    "default": 100,
-                    "minimum": 1,
-                    "maximum": 10000
-                },
-                "format": {
-                    "type": "string",
-                    "enum": ["json", "table", "csv"],
-                    "description": "Output format for query results",
-                    "default": "table"
-                },
-                "timeout": {
-                    "type": "integer",
-                    "description": "Query timeout in seconds",
-                    "default": 30,
-                    "minimum": 1,
-                    "maximum": 300
-                }
-            },
-            "required": ["query"]
+            "min_size": min(min_size, max_size),
+            "max_size": max_size,
+            "pool_timeout": float(params.get('pool_timeout', 30))
         }
     
+    def pool_status(self) -> Dict[str, Any]:
+        """
+        Report pool sizing and current usage for monitoring.
+        
+        Returns:
+            Dict with pool configuration and connection state
+        """
+        return {
+            **self.pool_config,
+            "connected": self._is_connected
+        }
+    
+    @property
+    def sql_dialect(self) -> Optional[str]:
+        """sqlglot dialect matching this connection's database_type."""
+        return _SQLGLOT_DIALECTS.get(str(self.connection_params.get('database_type', '')).lower())
+    
+    async def _ensure_connected(self) -> None:
+        """Connect if needed, serializing concurrent first connects."""
+        if self._is_connected:
+            return
+        
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        
+        async with self._connect_lock:
+            # Another caller may have connected while we waited
+            if not self._is_connected:
+                await self.connect()
+    
+    async def warmup(self) -> None:
+        """Open the connection ahead of the first query."""
+        await self._ensure_connected()
+    
     @abc.abstractmethod
     async def connect(self) -> None:
         """Establish database connection. Must be implemented by subclasses."""
@@ -102,12 +222,90 @@ class BaseDatabaseTool(BaseTool):
         """
         pass
     
+    async def stream_query(self, query: str, timeout: int = 30) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute SQL query and yield rows one at a time.
+        Subclasses with server-side cursors override this; the default
+        falls back to execute_query.
+        
+        Args:
+            query: SQL query to execute
+            timeout: Query timeout in seconds
+            
+        Yields:
+            Rows as dicts
+        """
+        rows, _ = await self.execute_query(query, timeout)
+        for row in rows:
+            yield row
+    
+    async def _stream_csv(self, query: str, timeout: int,
+                          **kwargs) -> Tuple[int, List[str], str]:
+        """
+        Write streamed query rows straight into CSV.
+        
+        Args:
+            query: SQL query to execute
+            timeout: Query timeout in seconds
+            **kwargs: Backend-specific options passed on to stream_query
+            
+        Returns:
+            Tuple of (row count, column names, CSV text)
+        """
+        output = io.StringIO()
+        writer = csv.writer(output)
+        columns: List[str] = []
+        row_count = 0
+        
+        async for row in self.stream_query(query, timeout, **kwargs):
+            if not row_count:
+                columns = list(row.keys())
+                writer.writerow(columns)
+            writer.writerow(row.values())
+            row_count += 1
+        
+        return row_count, columns, output.getvalue()
+    
     @abc.abstractmethod
-    async def get_schema_info(self) -> Dict[str, Any]:
-        """Get database schema information. Must be implemented by subclasses."""
+    async def get_schema_info(self, level: int = 2) -> Dict[str, Any]:
+        """
+        Get database schema information. Must be implemented by subclasses.
+        
+        Args:
+            level: 1 for schema names only, 2 to add tables and views,
+                3 to also add per-table details (see _describe_tables)
+        """
         pass
     
-    async def execute(self, query: str, limit: int = 100, format: str = "table", timeout: int = 30) -> Dict[str, Any]:
+    async def _describe_tables(self, tables: List[Tuple[Optional[str], str]]) -> Dict[str, Any]:
+        """
+        Run get_table_info for many tables concurrently, at most pool size at once.
+        Tables whose lookup fails are left out.
+        
+        Args:
+            tables: (schema name or None, table name) pairs
+            
+        Returns:
+            Dict of "schema.table" (or just the table name) -> table info
+        """
+        semaphore = asyncio.Semaphore(self.pool_config["max_size"])
+        
+        async def _describe(schema_name: Optional[str], table_name: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_table_info(table_name, schema_name)
+        
+        infos = await asyncio.gather(
+            *(_describe(schema_name, table_name) for schema_name, table_name in tables),
+            return_exceptions=True
+        )
+        return {
+            f"{schema_name}.{table_name}" if schema_name else table_name: info
+            for (schema_name, table_name), info in zip(tables, infos)
+            if not isinstance(info, Exception)
+        }
+    
+    async def execute(self, query: str, limit: int = 100, format: str = "table", timeout: int = 30,
+                      raw_json: bool = False, **kwargs) -> Dict[str, Any]:
         """
         Execute database query with standardized output.
         
@@ -116,32 +314,36 @@ class BaseDatabaseTool(BaseTool):
             limit: Maximum rows to return
             format: Output format (json, table, csv)
             timeout: Query timeout in seconds
+            raw_json: With format "json", return results as pre-serialized bytes
+            **kwargs: Backend-specific options; unknown keys are ignored
             
         Returns:
             Dict containing query results and metadata
         """
         try:
             # Ensure connection
-            if not self._is_connected:
-                await self.connect()
-            
-            # Validate query
-            self._validate_query(query)
+            await self._ensure_connected()
             
-            # Add limit if not present
-            limited_query = self._apply_limit(query, limit)
+            # Validate query and add limit if not present
+            limited_query = self._prepare_query(query, limit)
             
             # Execute query
-            start_time = datetime.now()
-            rows, columns = await self.execute_query(limited_query, timeout)
-            execution_time = (datetime.now() - start_time).total_seconds()
-            
-            # Format results
-            formatted_results = self._format_results(rows, columns, format)
+            start_ns = time.perf_counter_ns()
+            if format == "csv":
+                # CSV is written row by row, so never materialize the result set
+                row_count, columns, formatted_results = await self._stream_csv(limited_query, timeout)
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+            else:
+                rows, columns = await self.execute_query(limited_query, timeout)
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+                row_count = len(rows)
+                
+                # Format results
+                formatted_results = self._format_results(rows, columns, format, raw_json)
             
             return {
                 "query": limited_query,
-                "row_count": len(rows),
+                "row_count": row_count,
                 "columns": columns,
                 "execution_time_seconds": execution_time,
                 "results": formatted_results,
@@ -156,6 +358,35 @@ class BaseDatabaseTool(BaseTool):
             logger.error(f"Database query failed: {str(e)}")
             raise DatabaseQueryError(f"Query execution failed: {str(e)}")
     
+    def _prepare_query(self, query: str, limit: int) -> str:
+        """
+        Validate a query and apply its limit, reusing earlier work for repeats.
+        
+        Args:
+            query: Original SQL query
+            limit: Maximum rows to return
+            
+        Returns:
+            Query with LIMIT clause applied
+            
+        Raises:
+            DatabaseQueryError: If query contains dangerous patterns
+        """
+        key = (query, limit)
+        cached = self._prepared_queries.get(key)
+        if cached is not None:
+            self._prepared_queries.move_to_end(key)
+            return cached
+        
+        self._validate_query(query)
+        limited_query = self._apply_limit(query, limit)
+        
+        self._prepared_queries[key] = limited_query
+        if len(self._prepared_queries) > self.PREPARED_QUERY_CACHE_SIZE:
+            self._prepared_queries.popitem(last=False)
+        
+        return limited_query
+    
     def _validate_query(self, query: str) -> None:
         """
         Basic SQL query validation to prevent dangerous operations.
@@ -166,21 +397,13 @@ class BaseDatabaseTool(BaseTool):
         Raises:
             DatabaseQueryError: If query contains dangerous patterns
         """
-        query_upper = query.upper().strip()
-        
         # Block dangerous operations
-        dangerous_patterns = [
-            'DROP', 'DELETE', 'TRUNCATE', 'INSERT', 'UPDATE', 
-            'CREATE', 'ALTER', 'GRANT', 'REVOKE', 'EXEC',
-            'EXECUTE', 'CALL', 'MERGE', 'UPSERT'
-        ]
-        
-        for pattern in dangerous_patterns:
-            if f" {pattern} " in f" {query_upper} ":
-                raise DatabaseQueryError(f"Query contains forbidden operation: {pattern}")
+        match = _FORBIDDEN_RE.search(query)
+        if match:
+            raise DatabaseQueryError(f"Query contains forbidden operation: {match.group(1).upper()}")
         
         # Ensure it's a SELECT query
-        if not query_upper.startswith('SELECT') and not query_upper.startswith('WITH'):
+        if not _ALLOWED_PREFIX_RE.match(query):
             raise DatabaseQueryError("Only SELECT and WITH queries are allowed")
     
     def _apply_limit(self, query: str, limit: int) -> str:
@@ -194,16 +417,25 @@ class BaseDatabaseTool(BaseTool):
         Returns:
             Query with LIMIT clause applied
         """
-        query_upper = query.upper()
+        tree = _parse_sql(query, self.sql_dialect) if SQLGLOT_AVAILABLE else None
+        
+        if tree is not None and hasattr(tree, 'limit'):
+            # Check if LIMIT already exists on the outermost query
+            if tree.args.get('limit') or tree.args.get('fetch'):
+                return query
+            
+            # limit() copies, so the cached tree is left untouched
+            return tree.limit(limit).sql(dialect=self.sql_dialect)
         
         # Check if LIMIT already exists
-        if 'LIMIT' in query_upper:
+        if _LIMIT_RE.search(_COMMENT_OR_QUOTED_RE.sub(' ', query)):
             return query
         
-        # Add LIMIT clause
-        return f"{query.rstrip(';')} LIMIT {limit}"
+        # Add LIMIT clause on its own line so a trailing -- comment can't swallow it
+        return f"{query.rstrip().rstrip(';')}\nLIMIT {limit}"
     
-    def _format_results(self, rows: List[Dict], columns: List[str], format: str) -> Union[List[Dict], str]:
+    def _format_results(self, rows: List[Dict], columns: List[str], format: str,
+                        raw_json: bool = False) -> Union[List[Dict], str, bytes]:
         """
         Format query results according to specified format.
         
@@ -211,11 +443,14 @@ class BaseDatabaseTool(BaseTool):
             rows: Query result rows
             columns: Column names
             format: Output format (json, table, csv)
+            raw_json: With format "json", serialize rows straight to bytes
             
         Returns:
             Formatted results
         """
         if format == "json":
+            if raw_json:
+                return orjson.dumps(rows, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
             return rows
         
         elif format == "csv":
@@ -223,13 +458,10 @@ class BaseDatabaseTool(BaseTool):
                 return ""
             
             # Convert to CSV format
-            import io
-            import csv
-            
             output = io.StringIO()
-            writer = csv.DictWriter(output, fieldnames=columns)
-            writer.writeheader()
-            writer.writerows(rows)
+            writer = csv.writer(output)
+            writer.writerow(columns)
+            writer.writerows([[row.get(col) for col in columns] for row in rows])
             return output.getvalue()
         
         elif format == "table":
@@ -256,33 +488,98 @@ class BaseDatabaseTool(BaseTool):
         if not rows:
             return "No results found."
         
-        # Calculate column widths
-        widths = {}
-        for col in columns:
-            widths[col] = len(col)
-            for row in rows:
-                value = str(row.get(col, ''))
-                widths[col] = max(widths[col], len(value))
+        if not columns:
+            # Nothing to pad: an empty cell per row, as the header has none
+            return "\n".join(["+--+", "|  |", "+--+", *["|  |"] * len(rows), "+--+"])
+        
+        # Stringify each value as-is (no dtype inference), then pad column-wise in C
+        if isinstance(rows[0], dict):
+            cells = np.array([[str(row.get(col, '')) for col in columns] for row in rows], dtype=str)
+        else:
+            cells = np.array([[str(value) for value in row] for row in rows], dtype=str)
+        widths = np.maximum(
+            np.char.str_len(cells).max(axis=0),
+            np.fromiter((len(col) for col in columns), dtype=int, count=len(columns))
+        )
         
         # Create table
-        lines = []
+        header = "| " + " | ".join(col.ljust(width) for col, width in zip(columns, widths)) + " |"
+        separator = "+-" + "-+-".join("-" * width for width in widths) + "-+"
         
-        # Header
-        header = "| " + " | ".join(col.ljust(widths[col]) for col in columns) + " |"
-        separator = "+-" + "-+-".join("-" * widths[col] for col in columns) + "-+"
+        # Rows
+        body = np.char.add("| ", np.char.ljust(cells[:, 0], widths[0]))
+        for i in range(1, len(columns)):
+            body = np.char.add(np.char.add(body, " | "), np.char.ljust(cells[:, i], widths[i]))
+        body = np.char.add(body, " |")
         
-        lines.append(separator)
-        lines.append(header)
-        lines.append(separator)
+        return "\n".join([separator, header, separator, *body.tolist(), separator])
+    
+    async def cached_schema_info(self, level: int = 2) -> Dict[str, Any]:
+        """
+        Get schema information, reusing the last result until its TTL expires.
         
-        # Rows
-        for row in rows:
-            row_str = "| " + " | ".join(str(row.get(col, '')).ljust(widths[col]) for col in columns) + " |"
-            lines.append(row_str)
+        Args:
+            level: Detail level passed to get_schema_info; each level is cached separately
+            
+        Returns:
+            Dict with schema information
+        """
+        cached = self._schema_cache.get(level)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        if self._schema_lock is None:
+            self._schema_lock = asyncio.Lock()
         
-        lines.append(separator)
+        async with self._schema_lock:
+            # A concurrent caller may have refreshed it while we waited
+            cached = self._schema_cache.get(level)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+            
+            schema_info = await self.get_schema_info(level)
+            self._schema_cache[level] = (time.monotonic() + self._schema_ttl, schema_info)
+            return schema_info
+    
+    async def _cached_metadata(self, key: str,
+                               loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a cached metadata value, loading it if missing or expired.
+        
+        Args:
+            key: Cache key
+            loader: Coroutine function that fetches the value
+            
+        Returns:
+            The cached or freshly loaded value
+        """
+        entry = self._meta_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
         
-        return "\n".join(lines)
+        value = await loader()
+        if self._meta_ttl > 0:
+            self._meta_cache[key] = (time.monotonic() + self._meta_ttl, value)
+        return value
+    
+    def invalidate_metadata(self, prefix: str = None) -> None:
+        """
+        Drop cached table (and other) metadata, e.g. after DDL.
+        
+        Args:
+            prefix: Only drop keys starting with this, such as "table:" (all if omitted)
+        """
+        if prefix is None:
+            self._meta_cache.clear()
+            return
+        
+        for key in [key for key in self._meta_cache if key.startswith(prefix)]:
+            del self._meta_cache[key]
+    
+    def invalidate_schema(self) -> None:
+        """Drop cached schema information and metadata, e.g. after DDL changes."""
+        self._schema_cache.clear()
+        self.invalidate_metadata()
     
     async def test_connection(self) -> Dict[str, Any]:
         """
@@ -291,10 +588,14 @@ class BaseDatabaseTool(BaseTool):
         Returns:
             Dict with connection test results
         """
+        # Reuse a live connection rather than tearing it down after the test
+        was_connected = self._is_connected
         try:
-            await self.connect()
-            schema = await self.get_schema_info()
-            await self.disconnect()
+            await self._ensure_connected()
+            # Schema names are enough to prove the connection works
+            schema = await self.get_schema_info(level=1)
+            if not was_connected:
+                await self.disconnect()
             
             return {
                 "status": "success",
@@ -323,8 +624,14 @@ class BaseDatabaseTool(BaseTool):
         results = data.get("results", "")
         if isinstance(results, str):
             output += results
+        elif isinstance(results, bytes):
+            output += results.decode()
         else:
-            output += json.dumps(results, indent=2)
+            output += orjson.dumps(
+                results,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ).decode()
         
         return output
     
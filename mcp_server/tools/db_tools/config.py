@@ -3,8 +3,11 @@ Database Configuration Tool for MCP Server
 Creates and manages database configurations from environment variables and config files.
 """
 
+import asyncio
 import os
-import json
+import re
+import tempfile
+import orjson
 from typing import Dict, Any, List, Optional
 import logging
 from pathlib import Path
@@ -14,11 +17,56 @@ from .manager import DatabaseManagerTool
 
 logger = logging.getLogger("mcp_server.tools.database.config")
 
+# DB_<n>_<setting>; the connection name is the first underscore-free segment
+_DB_ENV_RE = re.compile(r'^DB_([A-Za-z0-9]+)_(.+)$')
+_INT_SETTINGS = frozenset({
+    'port', 'pool_size', 'min_size', 'max_size', 'min_connections', 'max_connections', 'timeout'
+})
+
 class DatabaseConfigTool(BaseTool):
     """
     Tool for managing database configurations and creating database manager instances.
     """
     
+    __slots__ = ('config_file', 'database_configs', 'manager', '_save_lock')
+    
+    # Built once; treat as read-only
+    _PARAMETERS: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": ["list_connections", "test_connections", "add_connection", "remove_connection", "update_connection"],
+                "description": "Action to perform on database configurations"
+            },
+            "connection_name": {
+                "type": "string",
+                "description": "Name of the database connection (for add/remove/update actions)"
+            },
+            "connection_config": {
+                "type": "object",
+                "description": "Database connection configuration (for add/update actions)",
+                "properties": {
+                    "database_type": {
+                        "type": "string",
+                        "enum": ["postgresql", "mysql", "sqlite", "snowflake"],
+                        "description": "Type of database"
+                    },
+                    "host": {"type": "string"},
+                    "port": {"type": "integer"},
+                    "database": {"type": "string"},
+                    "username": {"type": "string"},
+                    "password": {"type": "string"},
+                    "schema": {"type": "string"},
+                    "warehouse": {"type": "string"},
+                    "account": {"type": "string"},
+                    "role": {"type": "string"}
+                }
+            }
+        },
+        "required": ["action"]
+    }
+    
     def __init__(self, config_file: str = None):
         """
         Initialize database configuration tool.
@@ -34,6 +82,8 @@ class DatabaseConfigTool(BaseTool):
         self.config_file = config_file
         self.database_configs = {}
         self.manager = None
+        # Serializes saves so an older snapshot never replaces a newer one
+        self._save_lock: Optional[asyncio.Lock] = None
         
         # Load configurations
         self._load_configurations()
@@ -41,41 +91,7 @@ class DatabaseConfigTool(BaseTool):
     @property
     def parameters(self) -> Dict[str, Any]:
         """Define parameters for database configuration tool."""
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": ["list_connections", "test_connections", "add_connection", "remove_connection", "update_connection"],
-                    "description": "Action to perform on database configurations"
-                },
-                "connection_name": {
-                    "type": "string",
-                    "description": "Name of the database connection (for add/remove/update actions)"
-                },
-                "connection_config": {
-                    "type": "object",
-                    "description": "Database connection configuration (for add/update actions)",
-                    "properties": {
-                        "database_type": {
-                            "type": "string",
-                            "enum": ["postgresql", "mysql", "sqlite", "snowflake"],
-                            "description": "Type of database"
-                        },
-                        "host": {"type": "string"},
-                        "port": {"type": "integer"},
-                        "database": {"type": "string"},
-                        "username": {"type": "string"},
-                        "password": {"type": "string"},
-                        "schema": {"type": "string"},
-                        "warehouse": {"type": "string"},
-                        "account": {"type": "string"},
-                        "role": {"type": "string"}
-                    }
-                }
-            },
-            "required": ["action"]
-        }
+        return self._PARAMETERS
     
     def _load_configurations(self) -> None:
         """Load database configurations from environment variables and config file."""
@@ -89,7 +105,8 @@ class DatabaseConfigTool(BaseTool):
         # Create database manager if we have configurations
         if self.database_configs:
             try:
-                self.manager = DatabaseManagerTool(self.database_configs)
+                # The manager keeps its own registry, updated through add/update/remove_tool
+                self.manager = DatabaseManagerTool(dict(self.database_configs))
                 logger.info(f"Loaded {len(self.database_configs)} database configurations")
             except Exception as e:
                 logger.error(f"Failed to create database manager: {str(e)}")
@@ -100,23 +117,24 @@ class DatabaseConfigTool(BaseTool):
         db_vars = {}
         
         for key, value in os.environ.items():
-            if key.startswith('DB_'):
-                parts = key.split('_')
-                if len(parts) >= 3:  # DB_<n>_<setting>
-                    db_name = parts[1].lower()
-                    setting = '_'.join(parts[2:]).lower()
-                    
-                    if db_name not in db_vars:
-                        db_vars[db_name] = {}
-                    
-                    # Convert numeric values
-                    if setting == 'port':
-                        try:
-                            value = int(value)
-                        except ValueError:
-                            pass
-                    
-                    db_vars[db_name][setting] = value
+            if not key.startswith('DB_'):
+                continue
+            
+            match = _DB_ENV_RE.match(key)
+            if not match:
+                continue
+            
+            db_name = match.group(1).lower()
+            setting = match.group(2).lower()
+            
+            # Convert numeric values
+            if setting in _INT_SETTINGS:
+                try:
+                    value = int(value)
+                except ValueError:
+                    pass
+            
+            db_vars.setdefault(db_name, {})[setting] = value
         
         # Convert to proper connection configs
         for db_name, config in db_vars.items():
@@ -127,8 +145,8 @@ class DatabaseConfigTool(BaseTool):
     def _load_from_file(self) -> None:
         """Load database configurations from JSON file."""
         try:
-            with open(self.config_file, 'r') as f:
-                file_configs = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                file_configs = orjson.loads(f.read())
             
             # Merge with existing configs (file takes precedence)
             self.database_configs.update(file_configs)
@@ -137,17 +155,41 @@ class DatabaseConfigTool(BaseTool):
         except Exception as e:
             logger.error(f"Failed to load config file {self.config_file}: {str(e)}")
     
-    def _save_to_file(self) -> None:
-        """Save current configurations to file."""
+    async def _save(self) -> None:
+        """Save current configurations to file without blocking the event loop."""
         if not self.config_file:
             return
         
+        if self._save_lock is None:
+            self._save_lock = asyncio.Lock()
+        
+        async with self._save_lock:
+            # Serialize on the loop so the thread never sees the dict mid-update
+            data = orjson.dumps(self.database_configs, option=orjson.OPT_INDENT_2)
+            await asyncio.to_thread(self._save_to_file, data)
+    
+    def _save_to_file(self, data: bytes) -> None:
+        """
+        Write serialized configurations to the config file.
+        
+        Args:
+            data: JSON-encoded configurations
+        """
         try:
             # Create directory if it doesn't exist
-            Path(self.config_file).parent.mkdir(parents=True, exist_ok=True)
+            directory = Path(self.config_file).parent
+            directory.mkdir(parents=True, exist_ok=True)
             
-            with open(self.config_file, 'w') as f:
-                json.dump(self.database_configs, f, indent=2)
+            # Write a uniquely named file alongside the target and swap it in, so a
+            # crash can't truncate it and concurrent saves can't interleave
+            tmp_file = tempfile.NamedTemporaryFile(dir=directory, suffix='.tmp', delete=False)
+            try:
+                with tmp_file:
+                    tmp_file.write(data)
+                os.replace(tmp_file.name, self.config_file)
+            except Exception:
+                os.unlink(tmp_file.name)
+                raise
             
             logger.info(f"Saved database configurations to {self.config_file}")
             
@@ -176,17 +218,17 @@ class DatabaseConfigTool(BaseTool):
         elif action == "add_connection":
             if not connection_name or not connection_config:
                 raise ValueError("connection_name and connection_config required for add_connection")
-            return self._add_connection(connection_name, connection_config)
+            return await self._add_connection(connection_name, connection_config)
         
         elif action == "remove_connection":
             if not connection_name:
                 raise ValueError("connection_name required for remove_connection")
-            return self._remove_connection(connection_name)
+            return await self._remove_connection(connection_name)
         
         elif action == "update_connection":
             if not connection_name or not connection_config:
                 raise ValueError("connection_name and connection_config required for update_connection")
-            return self._update_connection(connection_name, connection_config)
+            return await self._update_connection(connection_name, connection_config)
         
         else:
             raise ValueError(f"Unknown action: {action}")
@@ -219,7 +261,7 @@ class DatabaseConfigTool(BaseTool):
         
         return await self.manager.test_all_connections()
     
-    def _add_connection(self, name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    async def _add_connection(self, name: str, config: Dict[str, Any]) -> Dict[str, Any]:
         """Add a new database connection configuration."""
         if name in self.database_configs:
             return {
@@ -236,29 +278,30 @@ class DatabaseConfigTool(BaseTool):
                     "message": f"Missing required field: {field}"
                 }
         
-        # Add the configuration
-        self.database_configs[name] = config
-        
-        # Recreate manager with new configs
+        # Register only the new connection; existing ones stay open
         try:
-            self.manager = DatabaseManagerTool(self.database_configs)
+            if self.manager:
+                self.manager.add_tool(name, config)
+            else:
+                self.manager = DatabaseManagerTool({**self.database_configs, name: config})
         except Exception as e:
-            # Rollback on error
-            del self.database_configs[name]
             return {
                 "status": "error",
                 "message": f"Failed to create connection: {str(e)}"
             }
         
-        # Save to file
-        self._save_to_file()
+        # Add the configuration once the manager accepted it
+        self.database_configs[name] = config
+        
+        # Save to file off the event loop
+        await self._save()
         
         return {
             "status": "success",
             "message": f"Connection {name} added successfully"
         }
     
-    def _remove_connection(self, name: str) -> Dict[str, Any]:
+    async def _remove_connection(self, name: str) -> Dict[str, Any]:
         """Remove a database connection configuration."""
         if name not in self.database_configs:
             return {
@@ -269,24 +312,22 @@ class DatabaseConfigTool(BaseTool):
         # Remove the configuration
         del self.database_configs[name]
         
-        # Recreate manager
-        if self.database_configs:
-            try:
-                self.manager = DatabaseManagerTool(self.database_configs)
-            except Exception as e:
-                logger.error(f"Failed to recreate manager after removal: {str(e)}")
-        else:
+        # Drop only the removed connection from the manager
+        if self.manager:
+            await self.manager.remove_tool(name)
+        
+        if not self.database_configs:
             self.manager = None
         
-        # Save to file
-        self._save_to_file()
+        # Save to file off the event loop
+        await self._save()
         
         return {
             "status": "success",
             "message": f"Connection {name} removed successfully"
         }
     
-    def _update_connection(self, name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    async def _update_connection(self, name: str, config: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing database connection configuration."""
         if name not in self.database_configs:
             return {
@@ -294,25 +335,25 @@ class DatabaseConfigTool(BaseTool):
                 "message": f"Connection {name} not found. Use add_connection to create it."
             }
         
-        # Store old config for rollback
-        old_config = self.database_configs[name].copy()
-        
-        # Update the configuration
-        self.database_configs[name].update(config)
+        # Build the new configuration; the old one stays in place until it is accepted
+        new_config = {**self.database_configs[name], **config}
         
-        # Recreate manager with updated configs
+        # Rebuild only the updated connection
         try:
-            self.manager = DatabaseManagerTool(self.database_configs)
+            if self.manager:
+                await self.manager.update_tool(name, new_config)
+            else:
+                self.manager = DatabaseManagerTool({**self.database_configs, name: new_config})
         except Exception as e:
-            # Rollback on error
-            self.database_configs[name] = old_config
             return {
                 "status": "error",
                 "message": f"Failed to update connection: {str(e)}"
             }
         
-        # Save to file
-        self._save_to_file()
+        self.database_configs[name] = new_config
+        
+        # Save to file off the event loop
+        await self._save()
         
         return {
             "status": "success",
@@ -328,29 +369,32 @@ class DatabaseConfigTool(BaseTool):
         if result.get("status") == "error":
             return f"Database Config error: {result.get('message', 'Unknown error')}"
         
-        if "connections" in result:
-            output = f"Database Connections ({result.get('total_connections', 0)} total):\n"
+        connections = result.get("connections")
+        connection_tests = result.get("connection_tests")
+        
+        if connections is not None:
+            parts = [f"Database Connections ({result.get('total_connections', 0)} total):\n"]
             
-            for name, config in result["connections"].items():
+            for name, config in connections.items():
                 db_type = config.get('database_type', 'unknown')
                 host = config.get('host', 'N/A')
                 database = config.get('database', 'N/A')
                 
-                output += f"- {name} ({db_type}): {host}/{database}\n"
+                parts.append(f"- {name} ({db_type}): {host}/{database}\n")
             
-            return output
+            return "".join(parts)
         
-        elif "connection_tests" in result:
-            output = "Database Connection Test Results:\n"
+        elif connection_tests is not None:
+            parts = ["Database Connection Test Results:\n"]
             
-            for name, test_result in result["connection_tests"].items():
+            for name, test_result in connection_tests.items():
                 status = test_result.get("status", "unknown")
-                output += f"- {name}: {status.upper()}\n"
+                parts.append(f"- {name}: {status.upper()}\n")
                 
                 if status == "error":
-                    output += f"  Error: {test_result.get('message', 'Unknown error')}\n"
+                    parts.append(f"  Error: {test_result.get('message', 'Unknown error')}\n")
             
-            return output
+            return "".join(parts)
         
         else:
             return result.get("message", str(result))
@@ -3,25 +3,63 @@ Database Manager Tool for MCP Server
 Manages multiple database connections and provides unified interface.
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 import logging
 import asyncio
+import orjson
+import re
+import time
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
 from ..base import BaseTool
-from .base import BaseDatabaseTool, DatabaseConnectionError, DatabaseQueryError
+from .base import BaseDatabaseTool, DatabaseConnectionError, DatabaseQueryError, PYARROW_AVAILABLE
 from .sql import SQLDatabaseTool, PostgreSQLTool, MySQLTool, SQLiteTool
 from .snowflake import SnowflakeTool
 
 logger = logging.getLogger("mcp_server.tools.database.manager")
 
+# Only plain reads are eligible for the result cache
+_CACHEABLE_RE = re.compile(r'(?is)^\s*(?:SELECT|WITH)\b')
+
+if PROMETHEUS_AVAILABLE:
+    QUERY_LATENCY = Histogram(
+        "mcp_db_query_seconds", "Database query latency", ["connection", "status"]
+    )
+    QUERY_COUNT = Counter(
+        "mcp_db_queries_total", "Database queries executed", ["connection", "status"]
+    )
+    CONNECTION_TESTS = Counter(
+        "mcp_db_connection_tests_total", "Database connection tests", ["connection", "status"]
+    )
+    CROSS_QUERY_LATENCY = Histogram(
+        "mcp_db_cross_query_seconds", "Cross-database query latency"
+    )
+    POOL_IN_USE = Gauge(
+        "mcp_db_pool_connections_in_use", "Pooled connections checked out", ["connection"]
+    )
+
+# format_for_llm constants
+_HEADER_TEST = "Database Connection Test Results:\n"
+_HEADER_OVERVIEW = "Database Connections Overview:\n"
+_ENCODER = orjson.dumps
+_ENCODER_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
 class DatabaseManagerTool(BaseTool):
     """
     Unified database manager that handles multiple database connections.
     Provides a single interface to query different database types.
     """
     
-    def __init__(self, database_configs: Dict[str, Dict[str, Any]]):
+    def __init__(self, database_configs: Dict[str, Dict[str, Any]],
+                 result_cache_ttl: float = 0, result_cache_size: int = 1024,
+                 result_cache_max_rows: int = 10000):
         """
         Initialize database manager.
         
@@ -47,6 +85,9 @@ class DatabaseManagerTool(BaseTool):
                         "schema": "PUBLIC"
                     }
                 }
+            result_cache_ttl: Seconds to reuse read-only query results (0 disables)
+            result_cache_size: Maximum number of cached results
+            result_cache_max_rows: Results with more rows than this are not cached
         """
         super().__init__(
             name="database_manager",
@@ -54,12 +95,31 @@ class DatabaseManagerTool(BaseTool):
         )
         
         self.database_configs = database_configs
+        # Tools are built from database_configs on first use
         self.connections: Dict[str, BaseDatabaseTool] = {}
-        self._initialize_connections()
+        # Bumped on every registry mutation so callers can cache derived data
+        self.version = 0
+        # (connection, query text, limit, format, options) -> (expiry, result)
+        self._result_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Same keys -> task for a read that is currently running
+        self._inflight: Dict[Tuple, "asyncio.Task"] = {}
+        self.result_cache_ttl = result_cache_ttl
+        self.result_cache_size = result_cache_size
+        self.result_cache_max_rows = result_cache_max_rows
+        # parameters schema, rebuilt only when version changes
+        self._parameters: Optional[Dict[str, Any]] = None
+        self._parameters_version = -1
     
     @property
     def parameters(self) -> Dict[str, Any]:
         """Define parameters for the database manager tool."""
+        if self._parameters_version != self.version:
+            self._parameters = self._build_parameters()
+            self._parameters_version = self.version
+        return self._parameters
+    
+    def _build_parameters(self) -> Dict[str, Any]:
+        """Build the parameters schema for the current set of connections."""
         connection_names = list(self.database_configs.keys())
         
         return {
@@ -98,29 +158,118 @@ class DatabaseManagerTool(BaseTool):
             "required": ["connection_name", "query"]
         }
     
-    def _initialize_connections(self) -> None:
-        """Initialize database connection objects."""
-        for name, config in self.database_configs.items():
+    async def warmup(self) -> Dict[str, str]:
+        """
+        Open every connection ahead of the first query.
+        Construction is synchronous, so call this once an event loop is
+        running, e.g. from an application startup hook.
+        
+        Returns:
+            Dict mapping connection names to "ready" or an error message
+        """
+        tools = self._resolve_all()
+        outcomes = await asyncio.gather(
+            *(db_tool.warmup() for _, db_tool in tools
+              if not isinstance(db_tool, Exception)),
+            return_exceptions=True
+        )
+        outcomes = iter(outcomes)
+        
+        status = {}
+        for name, db_tool in tools:
+            outcome = db_tool if isinstance(db_tool, Exception) else next(outcomes)
+            if isinstance(outcome, Exception):
+                logger.warning("Warmup failed for %s: %s", name, outcome)
+                status[name] = str(outcome)
+            else:
+                status[name] = "ready"
+        
+        return status
+    
+    @staticmethod
+    def _create_tool(config: Dict[str, Any]) -> BaseDatabaseTool:
+        """Instantiate the database tool matching a connection config."""
+        db_type = config.get('database_type', '').lower()
+        
+        if db_type == 'postgresql':
+            return PostgreSQLTool(config)
+        elif db_type == 'mysql':
+            return MySQLTool(config)
+        elif db_type == 'sqlite':
+            return SQLiteTool(config)
+        elif db_type == 'snowflake':
+            return SnowflakeTool(config)
+        else:
+            # Generic SQL tool
+            return SQLDatabaseTool(config)
+    
+    def add_tool(self, name: str, config: Dict[str, Any]) -> None:
+        """
+        Register a single connection without touching the others.
+        The connection itself is opened lazily on first query.
+        
+        Args:
+            name: Connection name
+            config: Connection configuration
+            
+        Raises:
+            Exception: If the database tool cannot be created
+        """
+        if name in self.database_configs:
+            raise DatabaseConnectionError(f"Connection already exists: {name}")
+        
+        self.connections[name] = self._create_tool(config)
+        self.database_configs[name] = config
+        self.version += 1
+        logger.info("Added %s connection: %s", config.get('database_type', '').lower(), name)
+    
+    async def remove_tool(self, name: str) -> None:
+        """
+        Disconnect and unregister a single connection.
+        
+        Args:
+            name: Connection name
+        """
+        db_tool = self.connections.pop(name, None)
+        self.database_configs.pop(name, None)
+        self.invalidate_query_cache(name)
+        self.version += 1
+        
+        if db_tool is not None:
             try:
-                db_type = config.get('database_type', '').lower()
-                
-                if db_type == 'postgresql':
-                    self.connections[name] = PostgreSQLTool(config)
-                elif db_type == 'mysql':
-                    self.connections[name] = MySQLTool(config)
-                elif db_type == 'sqlite':
-                    self.connections[name] = SQLiteTool(config)
-                elif db_type == 'snowflake':
-                    self.connections[name] = SnowflakeTool(config)
-                else:
-                    # Generic SQL tool
-                    self.connections[name] = SQLDatabaseTool(config)
-                    
-                logger.info(f"Initialized {db_type} connection: {name}")
-                
+                await db_tool.disconnect()
             except Exception as e:
-                logger.error(f"Failed to initialize connection {name}: {str(e)}")
-                # Continue with other connections
+                logger.error("Error disconnecting from %s: %s", name, e)
+        
+        logger.info("Removed connection: %s", name)
+    
+    async def update_tool(self, name: str, config: Dict[str, Any]) -> None:
+        """
+        Replace a single connection with one built from a new config.
+        The old connection is only closed once the new tool is created.
+        
+        Args:
+            name: Connection name
+            config: New connection configuration
+            
+        Raises:
+            Exception: If the database tool cannot be created
+        """
+        new_tool = self._create_tool(config)
+        old_tool = self.connections.get(name)
+        
+        self.connections[name] = new_tool
+        self.database_configs[name] = config
+        self.invalidate_query_cache(name)
+        self.version += 1
+        
+        if old_tool is not None:
+            try:
+                await old_tool.disconnect()
+            except Exception as e:
+                logger.error("Error disconnecting from %s: %s", name, e)
+        
+        logger.info("Updated connection: %s", name)
     
     async def execute(self, connection_name: str, query: str, limit: int = 100, 
                      format: str = "table", timeout: int = 30, **kwargs) -> Dict[str, Any]:
@@ -134,79 +283,280 @@ class DatabaseManagerTool(BaseTool):
             format: Output format (json, table, csv)
             timeout: Query timeout in seconds
             **kwargs: Additional database-specific parameters
+                - use_cache: Set False to bypass the result cache for this call
             
         Returns:
             Dict containing query results and metadata
         """
-        if connection_name not in self.connections:
-            raise DatabaseConnectionError(f"Unknown connection: {connection_name}")
+        db_tool = self._resolve(connection_name)
+        use_cache = kwargs.pop('use_cache', True)
         
-        db_tool = self.connections[connection_name]
+        key = None
+        if _CACHEABLE_RE.match(query):
+            # Exact text: collapsing whitespace would also merge string literals
+            key = (
+                connection_name, query, limit, format,
+                tuple(sorted(kwargs.items()))
+            )
+            try:
+                hash(key)
+            except TypeError:
+                key = None
+        
+        if key is None:
+            return await self._execute_on_tool(db_tool, connection_name, query, limit,
+                                               format, timeout, None, **kwargs)
+        
+        cache_key = key if use_cache and self.result_cache_ttl > 0 else None
+        if cache_key is not None:
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                return cached
+        
+        # Identical reads already running share one round-trip
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._execute_on_tool(
+                db_tool, connection_name, query, limit, format, timeout, cache_key, **kwargs
+            ))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
         
+        # Shielded so one caller's cancellation doesn't fail the others
+        return dict(await asyncio.shield(task))
+    
+    async def _execute_on_tool(self, db_tool: BaseDatabaseTool, connection_name: str,
+                               query: str, limit: int, format: str, timeout: int,
+                               cache_key: Optional[Tuple], **kwargs) -> Dict[str, Any]:
+        """Run a query on a tool, tag it with connection info and cache it if keyed."""
+        start = time.perf_counter()
+        status = "error"
         try:
-            # Execute query using the specific database tool
-            if isinstance(db_tool, SnowflakeTool):
-                # Pass Snowflake-specific parameters
-                warehouse = kwargs.get('warehouse')
-                use_cached_result = kwargs.get('use_cached_result', True)
-                result = await db_tool.execute(
-                    query, limit, format, timeout, warehouse, use_cached_result
-                )
+            # Large CSV exports stay on the tool's streaming path instead of
+            # materializing the whole result as one Arrow table
+            streamed_csv = format == 'csv' and limit > getattr(db_tool, 'STREAM_THRESHOLD', limit)
+            if (PYARROW_AVAILABLE and format in ('json', 'csv') and not kwargs.get('raw_json')
+                    and not streamed_csv and hasattr(db_tool, 'execute_arrow')):
+                coro = self._execute_arrow(db_tool, query, limit, format, timeout, **kwargs)
             else:
-                # Standard SQL execution
-                result = await db_tool.execute(query, limit, format, timeout)
+                # Each tool picks out the extra parameters it understands
+                coro = db_tool.execute(query, limit, format, timeout, **kwargs)
+            
+            # Backends also set a server-side statement timeout; this bounds
+            # the coroutine itself in case a driver read hangs
+            result = await asyncio.wait_for(coro, timeout=timeout)
             
             # Add connection metadata
             result["connection_name"] = connection_name
             result["connection_type"] = db_tool.name
             
+            if cache_key is not None and result.get("row_count", 0) <= self.result_cache_max_rows:
+                self._store_cached_result(cache_key, result)
+            
+            status = "ok"
             return result
             
+        except asyncio.TimeoutError:
+            status = "timeout"
+            message = "Query on %s exceeded %ss" % (connection_name, timeout)
+            logger.error(message)
+            raise DatabaseQueryError(message)
         except Exception as e:
-            logger.error(f"Query failed on {connection_name}: {str(e)}")
-            raise DatabaseQueryError(f"Query failed on {connection_name}: {str(e)}")
+            message = "Query failed on %s: %s" % (connection_name, e)
+            logger.error(message)
+            raise DatabaseQueryError(message)
+        finally:
+            if PROMETHEUS_AVAILABLE:
+                self._record_query(db_tool, connection_name, status, time.perf_counter() - start)
     
-    async def get_connection_info(self, connection_name: str = None) -> Dict[str, Any]:
+    @staticmethod
+    def _record_query(db_tool: BaseDatabaseTool, connection_name: str,
+                      status: str, seconds: float) -> None:
+        """Update query metrics and the connection's pool usage gauge."""
+        QUERY_LATENCY.labels(connection=connection_name, status=status).observe(seconds)
+        QUERY_COUNT.labels(connection=connection_name, status=status).inc()
+        
+        checked_out = db_tool.pool_status().get("checked_out")
+        if checked_out is not None:
+            POOL_IN_USE.labels(connection=connection_name).set(checked_out)
+    
+    async def _execute_arrow(self, db_tool: BaseDatabaseTool, query: str, limit: int,
+                             format: str, timeout: int, **kwargs) -> Dict[str, Any]:
+        """
+        Execute a query through a tool's Arrow path and convert only at the end.
+        Skips the per-row dict cursor and DataFrame round-trip; CSV is written
+        straight from the Arrow columns.
+        
+        Returns:
+            Dict shaped like BaseDatabaseTool.execute() output
+        """
+        limited_query = db_tool._prepare_query(query, limit)
+        
+        start = time.perf_counter_ns()
+        table = await db_tool.execute_arrow(
+            limited_query, timeout,
+            kwargs.get('warehouse'), kwargs.get('use_cached_result', True)
+        )
+        execution_time = (time.perf_counter_ns() - start) / 1e9
+        
+        # The tool converts the Arrow table column-wise
+        formatted_results = db_tool._format_results(table, table.column_names, format)
+        
+        return {
+            "query": limited_query,
+            "row_count": table.num_rows,
+            "columns": table.column_names,
+            "execution_time_seconds": execution_time,
+            "results": formatted_results,
+            "metadata": {
+                "database_type": db_tool.name,
+                "limit_applied": limit,
+                "format": format,
+                "arrow": True
+            }
+        }
+    
+    def _resolve(self, connection_name: str) -> BaseDatabaseTool:
+        """
+        Look up a connection's tool, building it on first use.
+        Construction is synchronous, so concurrent callers on the event loop
+        can't race to build the same tool twice.
+        
+        Raises:
+            DatabaseConnectionError: If the connection isn't configured or its
+                tool can't be created
+        """
+        db_tool = self.connections.get(connection_name)
+        if db_tool is not None:
+            return db_tool
+        
+        config = self.database_configs.get(connection_name)
+        if config is None:
+            raise DatabaseConnectionError(f"Unknown connection: {connection_name}")
+        
+        try:
+            db_tool = self._create_tool(config)
+        except Exception as e:
+            message = "Failed to initialize connection %s: %s" % (connection_name, e)
+            logger.error(message)
+            raise DatabaseConnectionError(message)
+        
+        self.connections[connection_name] = db_tool
+        logger.info("Initialized %s connection: %s", config.get('database_type', '').lower(), connection_name)
+        return db_tool
+    
+    def _resolve_all(self) -> List[Tuple[str, Union[BaseDatabaseTool, Exception]]]:
+        """Resolve every configured connection, keeping creation errors per name."""
+        tools = []
+        for name in list(self.database_configs):
+            try:
+                tools.append((name, self._resolve(name)))
+            except DatabaseConnectionError as e:
+                tools.append((name, e))
+        return tools
+    
+    def _get_cached_result(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Return a copy of a live cached result, dropping it if expired."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        
+        if entry[0] <= time.monotonic():
+            del self._result_cache[key]
+            return None
+        
+        self._result_cache.move_to_end(key)
+        return dict(entry[1])
+    
+    def _store_cached_result(self, key: Tuple, result: Dict[str, Any]) -> None:
+        """Cache a query result, evicting the least recently used entry when full."""
+        self._result_cache[key] = (time.monotonic() + self.result_cache_ttl, dict(result))
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+    
+    def invalidate_query_cache(self, connection_name: str = None) -> None:
+        """
+        Drop cached query results.
+        
+        Args:
+            connection_name: Specific connection to invalidate (all if omitted)
+        """
+        if connection_name is None:
+            self._result_cache.clear()
+            return
+        
+        for key in [key for key in self._result_cache if key[0] == connection_name]:
+            del self._result_cache[key]
+    
+    async def get_connection_info(self, connection_name: str = None, level: int = 2) -> Dict[str, Any]:
         """
         Get information about database connections.
         
         Args:
             connection_name: Specific connection name (optional)
+            level: Schema detail level; 1 schemas, 2 tables and views, 3 columns too
             
         Returns:
             Dict with connection information
         """
         if connection_name:
-            if connection_name not in self.connections:
-                raise DatabaseConnectionError(f"Unknown connection: {connection_name}")
-            
-            db_tool = self.connections[connection_name]
-            schema_info = await db_tool.get_schema_info()
+            db_tool = self._resolve(connection_name)
+            schema_info = await db_tool.cached_schema_info(level)
             
             return {
                 "connection_name": connection_name,
                 "connection_type": db_tool.name,
-                "schema_info": schema_info
+                "schema_info": schema_info,
+                "pool": db_tool.pool_status()
             }
         else:
-            # Return info for all connections
+            # Return info for all connections, fetched concurrently
+            resolved = self._resolve_all()
+            tools = [(name, db_tool) for name, db_tool in resolved
+                     if not isinstance(db_tool, Exception)]
+            schemas = await asyncio.gather(
+                *(db_tool.cached_schema_info(level) for _, db_tool in tools),
+                return_exceptions=True
+            )
+            
             connections_info = {}
+            for name, db_tool in resolved:
+                if isinstance(db_tool, Exception):
+                    connections_info[name] = {
+                        "connection_type": self.database_configs[name].get('database_type', 'unknown'),
+                        "error": str(db_tool)
+                    }
             
-            for name, db_tool in self.connections.items():
-                try:
-                    schema_info = await db_tool.get_schema_info()
+            for (name, db_tool), schema_info in zip(tools, schemas):
+                if isinstance(schema_info, Exception):
                     connections_info[name] = {
                         "connection_type": db_tool.name,
-                        "schema_info": schema_info
+                        "error": str(schema_info),
+                        "pool": db_tool.pool_status()
                     }
-                except Exception as e:
+                else:
                     connections_info[name] = {
                         "connection_type": db_tool.name,
-                        "error": str(e)
+                        "schema_info": schema_info,
+                        "pool": db_tool.pool_status()
                     }
             
             return {"connections": connections_info}
     
+    def invalidate_schema_cache(self, connection_name: str = None) -> None:
+        """
+        Drop cached schema information, e.g. after DDL changes.
+        
+        Args:
+            connection_name: Specific connection to invalidate (all if omitted)
+        """
+        if connection_name:
+            self._resolve(connection_name).invalidate_schema()
+        else:
+            for db_tool in self.connections.values():
+                db_tool.invalidate_schema()
+    
     async def test_connection(self, connection_name: str) -> Dict[str, Any]:
         """
         Test a specific database connection.
@@ -217,22 +567,28 @@ class DatabaseManagerTool(BaseTool):
         Returns:
             Dict with test results
         """
-        if connection_name not in self.connections:
+        try:
+            db_tool = self._resolve(connection_name)
+        except DatabaseConnectionError as e:
             return {
                 "connection_name": connection_name,
                 "status": "error",
-                "message": f"Unknown connection: {connection_name}"
+                "message": str(e)
             }
         
-        db_tool = self.connections[connection_name]
-        
         try:
             result = await db_tool.test_connection()
             result["connection_name"] = connection_name
             result["connection_type"] = db_tool.name
+            if PROMETHEUS_AVAILABLE:
+                CONNECTION_TESTS.labels(
+                    connection=connection_name, status=result.get("status", "unknown")
+                ).inc()
             return result
             
         except Exception as e:
+            if PROMETHEUS_AVAILABLE:
+                CONNECTION_TESTS.labels(connection=connection_name, status="error").inc()
             return {
                 "connection_name": connection_name,
                 "connection_type": db_tool.name,
@@ -247,10 +603,21 @@ class DatabaseManagerTool(BaseTool):
         Returns:
             Dict with test results for all connections
         """
-        results = {}
+        names = list(self.database_configs.keys())
+        tests = await asyncio.gather(
+            *(self.test_connection(name) for name in names),
+            return_exceptions=True
+        )
         
-        for name in self.connections.keys():
-            results[name] = await self.test_connection(name)
+        results = {}
+        for name, test in zip(names, tests):
+            if isinstance(test, Exception):
+                test = {
+                    "connection_name": name,
+                    "status": "error",
+                    "message": str(test)
+                }
+            results[name] = test
         
         return {"connection_tests": results}
     
@@ -267,10 +634,7 @@ class DatabaseManagerTool(BaseTool):
         Returns:
             Dict with table information
         """
-        if connection_name not in self.connections:
-            raise DatabaseConnectionError(f"Unknown connection: {connection_name}")
-        
-        db_tool = self.connections[connection_name]
+        db_tool = self._resolve(connection_name)
         
         if hasattr(db_tool, 'get_table_info'):
             table_info = await db_tool.get_table_info(table_name, schema_name)
@@ -291,54 +655,124 @@ class DatabaseManagerTool(BaseTool):
                 - query: SQL query to execute
                 - limit: Optional row limit
                 - format: Optional output format
+                - timeout: Optional timeout in seconds (default 30)
             combine_results: Whether to combine results from all queries
             
         Returns:
             Dict with results from all queries
         """
+        start = time.perf_counter()
         results = {}
-        combined_data = []
+        # (query number, connection name, rows) for each combinable result
+        combine_sources = []
         
+        # Group by connection so backends that batch can take one round-trip
+        groups: Dict[str, List[int]] = defaultdict(list)
         for i, query_spec in enumerate(queries):
+            groups[query_spec['connection_name']].append(i)
+        
+        # Connections are independent, so run the groups concurrently
+        gathered: List[Any] = [None] * len(queries)
+        
+        async def run_group(indexes: List[int]) -> None:
+            specs = [queries[i] for i in indexes]
+            for i, outcome in zip(indexes, await self._run_query_group(specs)):
+                gathered[i] = outcome
+        
+        await asyncio.gather(*(run_group(indexes) for indexes in groups.values()))
+        
+        if PROMETHEUS_AVAILABLE:
+            CROSS_QUERY_LATENCY.observe(time.perf_counter() - start)
+        
+        for i, (query_spec, result) in enumerate(zip(queries, gathered)):
             connection_name = query_spec['connection_name']
-            query = query_spec['query']
-            limit = query_spec.get('limit', 100)
             format_type = query_spec.get('format', 'json')  # Use json for combining
             
-            try:
-                result = await self.execute(connection_name, query, limit, format_type)
-                results[f"query_{i+1}_{connection_name}"] = result
-                
-                if combine_results and format_type == 'json':
-                    # Add connection info to each row
-                    query_results = result.get('results', [])
-                    for row in query_results:
-                        row['_source_connection'] = connection_name
-                        row['_source_query'] = i + 1
-                    combined_data.extend(query_results)
-                    
-            except Exception as e:
+            if isinstance(result, Exception):
                 results[f"query_{i+1}_{connection_name}"] = {
                     "status": "error",
-                    "error": str(e)
+                    "error": str(result) or type(result).__name__
                 }
+                continue
+            
+            results[f"query_{i+1}_{connection_name}"] = result
+            
+            if combine_results and format_type == 'json':
+                combine_sources.append((i + 1, connection_name, result.get('results', [])))
         
         if combine_results:
+            # Add connection info to copies of each row so cached results stay untouched
             results["combined_results"] = {
-                "total_rows": len(combined_data),
-                "data": combined_data
+                "total_rows": sum(len(rows) for _, _, rows in combine_sources),
+                "data": [
+                    {**row, '_source_connection': connection_name, '_source_query': query_number}
+                    for query_number, connection_name, rows in combine_sources
+                    for row in rows
+                ]
             }
         
         return results
     
+    async def _run_query_group(self, specs: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Run query specs that share a connection.
+        
+        Backends with execute_batch get a single request; otherwise, or if the
+        batch fails, specs run concurrently one by one.
+        
+        Returns:
+            One result dict or exception per spec, in order
+        """
+        connection_name = specs[0]['connection_name']
+        try:
+            db_tool = self._resolve(connection_name)
+        except DatabaseConnectionError:
+            # Each spec reports the error through execute()
+            db_tool = None
+        
+        if len(specs) > 1 and hasattr(db_tool, 'execute_batch'):
+            timeout = max(spec.get('timeout', 30) for spec in specs)
+            try:
+                batch = await asyncio.wait_for(
+                    db_tool.execute_batch(
+                        [(spec['query'], spec.get('limit', 100), spec.get('format', 'json'))
+                         for spec in specs],
+                        timeout
+                    ),
+                    timeout=timeout
+                )
+                for result in batch:
+                    result["connection_name"] = connection_name
+                    result["connection_type"] = db_tool.name
+                return batch
+            except Exception as e:
+                logger.warning("Batch on %s failed, running queries individually: %s", connection_name, e)
+        
+        return await asyncio.gather(
+            *(self._run_query_spec(spec) for spec in specs),
+            return_exceptions=True
+        )
+    
+    async def _run_query_spec(self, query_spec: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute one cross-database query spec; execute() enforces its timeout."""
+        return await self.execute(
+            query_spec['connection_name'],
+            query_spec['query'],
+            query_spec.get('limit', 100),
+            query_spec.get('format', 'json'),
+            query_spec.get('timeout', 30)
+        )
+    
     async def disconnect_all(self) -> None:
         """Disconnect all database connections."""
         for name, db_tool in self.connections.items():
             try:
                 await db_tool.disconnect()
-                logger.info(f"Disconnected from {name}")
+                logger.info("Disconnected from %s", name)
             except Exception as e:
-                logger.error(f"Error disconnecting from {name}: {str(e)}")
+                logger.error("Error disconnecting from %s: %s", name, e)
+        
+        self.version += 1
     
     def format_for_llm(self, result: Dict[str, Any]) -> str:
         """Format database manager results for LLM consumption."""
@@ -346,55 +780,66 @@ class DatabaseManagerTool(BaseTool):
             return f"Database Manager error: {result.get('error')}"
         
         # Check if this is a connection test result
-        if "connection_tests" in result:
-            output = "Database Connection Test Results:\n"
-            for name, test_result in result["connection_tests"].items():
+        connection_tests = result.get("connection_tests")
+        if connection_tests is not None:
+            parts = [_HEADER_TEST]
+            for name, test_result in connection_tests.items():
                 status = test_result.get("status", "unknown")
-                output += f"- {name}: {status.upper()}\n"
+                parts.append(f"- {name}: {status.upper()}\n")
                 if status == "error":
-                    output += f"  Error: {test_result.get('message', 'Unknown error')}\n"
-            return output
+                    parts.append(f"  Error: {test_result.get('message', 'Unknown error')}\n")
+            return "".join(parts)
         
         # Check if this is connection info
-        if "connections" in result:
-            output = "Database Connections Overview:\n"
-            for name, info in result["connections"].items():
-                conn_type = info.get("connection_type", "unknown")
-                output += f"- {name} ({conn_type})\n"
+        connections = result.get("connections")
+        if connections is not None:
+            parts = [_HEADER_OVERVIEW]
+            for name, info in connections.items():
+                parts.append(f"- {name} ({info.get('connection_type', 'unknown')})\n")
                 if "error" in info:
-                    output += f"  Error: {info['error']}\n"
+                    parts.append(f"  Error: {info['error']}\n")
                 elif "schema_info" in info:
-                    schema_info = info["schema_info"]
-                    if "tables" in schema_info:
-                        table_count = sum(len(tables) for tables in schema_info["tables"].values())
-                        output += f"  Tables: {table_count}\n"
-            return output
+                    tables = info["schema_info"].get("tables")
+                    if tables is not None:
+                        table_count = sum(map(len, tables.values()))
+                        parts.append(f"  Tables: {table_count}\n")
+            return "".join(parts)
         
         # Regular query result
         connection_name = result.get("connection_name", "unknown")
         connection_type = result.get("connection_type", "unknown")
         
         data = result.get("result", result)
-        row_count = data.get("row_count", 0)
-        execution_time = data.get("execution_time_seconds", 0)
         
-        output = f"Database Query Results ({connection_name} - {connection_type}):\n"
-        output += f"Rows returned: {row_count}\n"
-        output += f"Execution time: {execution_time:.2f} seconds\n\n"
+        parts = [
+            f"Database Query Results ({connection_name} - {connection_type}):\n",
+            f"Rows returned: {data.get('row_count', 0)}\n",
+            f"Execution time: {data.get('execution_time_seconds', 0):.2f} seconds\n\n"
+        ]
         
         results = data.get("results", "")
         if isinstance(results, str):
-            output += results
+            parts.append(results)
+        elif isinstance(results, bytes):
+            parts.append(results.decode())
         else:
-            import json
-            output += json.dumps(results, indent=2)
+            parts.append(_ENCODER(results, default=str, option=_ENCODER_OPTIONS).decode())
         
-        return output
+        return "".join(parts)
     
     def get_available_connections(self) -> List[str]:
         """Get list of available connection names."""
-        return list(self.connections.keys())
+        return list(self.database_configs.keys())
     
     def get_connection_types(self) -> Dict[str, str]:
         """Get mapping of connection names to their types."""
-        return {name: tool.name for name, tool in self.connections.items()}
+        return {name: self._tool_name(name) for name in self.database_configs}
+    
+    def _tool_name(self, connection_name: str) -> str:
+        """Name of a connection's tool, without building it if it isn't in use yet."""
+        db_tool = self.connections.get(connection_name)
+        if db_tool is not None:
+            return db_tool.name
+        
+        db_type = self.database_configs[connection_name].get('database_type', '').lower()
+        return 'snowflake' if db_type == 'snowflake' else f"sql_database_{db_type}"
@@ -4,28 +4,112 @@ Provides connectivity to Snowflake data warehouse.
 """
 
 import asyncio
-from typing import Dict, Any, List, Tuple, Optional
+import atexit
+import csv
+import hashlib
+import io
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Deque, Dict, Any, List, Tuple, Optional, Union
 import logging
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor
 
 try:
     import snowflake.connector
     from snowflake.connector import DictCursor
+    from snowflake.connector.errors import NotSupportedError
     import snowflake.connector.pandas_tools as pd_tools
     SNOWFLAKE_AVAILABLE = True
 except ImportError:
     SNOWFLAKE_AVAILABLE = False
 
-from .base import BaseDatabaseTool, DatabaseConnectionError, DatabaseQueryError
+from .base import BaseDatabaseTool, DatabaseConnectionError, DatabaseQueryError, PYARROW_AVAILABLE
+
+if PYARROW_AVAILABLE:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
 
 logger = logging.getLogger("mcp_server.tools.database.snowflake")
 
+# One I/O thread pool for every SnowflakeTool, created on first use
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _shared_executor() -> ThreadPoolExecutor:
+    """Return the process-wide thread pool for blocking connector calls."""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4),
+                    thread_name_prefix="snowflake-io"
+                )
+                atexit.register(_EXECUTOR.shutdown, wait=False)
+    return _EXECUTOR
+
+# Table and schema names accepted for IDENTIFIER() binding
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_$.]*$')
+
+# Shapes that usually mean a scan-heavy query, routed to the "large" warehouse
+_HEAVY_QUERY_RE = re.compile(
+    r'(?i)\b(?:GROUP\s+BY\b|JOIN\b|OVER\s*\(|DISTINCT\b|UNION\b|PIVOT\b)'
+)
+
+# Most recent successful run of a fingerprinted query still in the result cache.
+# RESULT_SCAN returns that run's rows as-is, even if the tables changed since.
+_RESULT_REUSE_SQL = (
+    "SELECT query_id "
+    "FROM TABLE(information_schema.query_history_by_user(RESULT_LIMIT => 1000)) "
+    "WHERE query_tag = %s AND query_text = %s AND execution_status = 'SUCCESS' "
+    "AND start_time > DATEADD('hour', -%s, CURRENT_TIMESTAMP()) "
+    "ORDER BY start_time DESC LIMIT 1"
+)
+
+# Queries whose results change between runs are never cached client-side
+_NONDETERMINISTIC_RE = re.compile(
+    r'(?i)\b(?:CURRENT_TIMESTAMP|CURRENT_DATE|CURRENT_TIME|LOCALTIMESTAMP|LOCALTIME|'
+    r'SYSDATE|GETDATE|RANDOM|UUID_STRING|SEQ[1248]|NORMAL|UNIFORM)\b'
+)
+
 class SnowflakeTool(BaseDatabaseTool):
     """
     Tool for connecting to Snowflake data warehouse.
     """
     
+    __slots__ = ('_result_cache', '_result_cache_ttl', '_result_cache_size',
+                 '_result_cache_stats', '_inflight_queries',
+                 '_pool', '_pool_sem', '_pool_open', '_pool_generation',
+                 '_idle_timeout', '_test_interval', '_session_state',
+                 '_warehouse_map', '_heavy_sem', '_conn_kwargs', '_result_reuse_hours',
+                 '_prewarm', '_prewarm_query', '_keepalive_interval', '_keepalive_task')
+    
+    # CSV results for limits above this stream through a server-side cursor
+    STREAM_THRESHOLD = 10000
+    
+    # Base schema plus Snowflake-specific options
+    _PARAMETERS: Dict[str, Any] = {
+        **BaseDatabaseTool._PARAMETERS,
+        "properties": {
+            **BaseDatabaseTool._PARAMETERS["properties"],
+            "warehouse": {
+                "type": "string",
+                "description": "Snowflake warehouse to use for query execution"
+            },
+            "use_cached_result": {
+                "type": "boolean",
+                "description": "Whether to use cached query results",
+                "default": True
+            }
+        }
+    }
+    
     def __init__(self, connection_params: Dict[str, Any]):
         """
         Initialize Snowflake database tool.
@@ -46,6 +130,29 @@ class SnowflakeTool(BaseDatabaseTool):
                 - private_key_passphrase: Passphrase for private key
                 - authenticator: Authentication method ('snowflake', 'oauth', etc.)
                 - session_parameters: Additional session parameters
+                - result_cache_ttl: Seconds to keep query results in memory (0 disables)
+                - result_cache_size: Maximum number of cached results
+                - min_size / max_size / pool_timeout: Session pool sizing
+                - idle_timeout: Seconds before an idle session is closed (default 600)
+                - test_interval: Idle seconds after which a session is checked
+                  with SELECT 1 before reuse (default 60)
+                - metadata_cache_ttl: Seconds to reuse warehouse and table
+                  metadata (default 60, 0 disables)
+                - warehouse_map: {"small": ..., "large": ...} warehouses used
+                  when a query doesn't name one, picked by query shape
+                - result_reuse_hours: Reuse results of identical deterministic
+                  queries run by this user within this many hours via
+                  RESULT_SCAN (0 disables, at most 24). Unlike Snowflake's own
+                  result cache this does not check whether the underlying
+                  tables changed, so results can be up to this old; every
+                  cache miss also costs a query_history lookup. Only enable
+                  it for data that is fine to serve stale.
+                - prewarm: Resume the warehouse on connect with SYSTEM$WAIT(0)
+                - prewarm_query: Small query (e.g. against a canary table) run
+                  on connect to load the warehouse's local cache
+                - warehouse_keepalive: Seconds between keepalive queries that
+                  stop the warehouse suspending while connected (0 disables;
+                  about half the warehouse AUTO_SUSPEND works well)
         """
         if not SNOWFLAKE_AVAILABLE:
             raise ImportError(
@@ -59,69 +166,382 @@ class SnowflakeTool(BaseDatabaseTool):
             connection_params=connection_params
         )
         
-        self.executor = ThreadPoolExecutor(max_workers=2)
+        # key -> (expiry, (rows, columns)); see _result_cache_key
+        self._result_cache: "OrderedDict[Tuple, Tuple[float, Tuple[List[Dict], List[str]]]]" = OrderedDict()
+        self._result_cache_ttl = float(connection_params.get('result_cache_ttl', 0))
+        self._result_cache_size = int(connection_params.get('result_cache_size', 256))
+        self._result_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        # Same keys -> task for a fetch that is currently running
+        self._inflight_queries: Dict[Tuple, "asyncio.Task"] = {}
         
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        """Override to include Snowflake-specific parameters."""
-        base_params = super().parameters
-        
-        # Add Snowflake-specific options
-        base_params["properties"]["warehouse"] = {
-            "type": "string",
-            "description": "Snowflake warehouse to use for query execution"
-        }
-        base_params["properties"]["use_cached_result"] = {
-            "type": "boolean",
-            "description": "Whether to use cached query results",
-            "default": True
-        }
-        
-        return base_params
+        # Idle sessions as (connection, last used); each query borrows one
+        self._pool: Deque[Tuple[Any, float]] = deque()
+        self._pool_sem: Optional[asyncio.Semaphore] = None
+        self._pool_open = 0
+        # Bumped by disconnect() so sessions borrowed before it are closed on return
+        self._pool_generation = 0
+        self._idle_timeout = float(connection_params.get('idle_timeout', 600))
+        self._test_interval = float(connection_params.get('test_interval', 60))
+        # id(session) -> last applied warehouse / timeout / use_cache values
+        self._session_state: Dict[int, Dict[str, Any]] = {}
+        self._warehouse_map: Dict[str, str] = dict(connection_params.get('warehouse_map') or {})
+        # Caps concurrent "large" queries so small ones always find a session
+        self._heavy_sem: Optional[asyncio.Semaphore] = None
+        # RESULT_SCAN can only read results from the last 24 hours
+        self._result_reuse_hours = min(int(connection_params.get('result_reuse_hours', 0)), 24)
+        self._prewarm = bool(connection_params.get('prewarm', False))
+        self._prewarm_query: Optional[str] = connection_params.get('prewarm_query')
+        self._keepalive_interval = float(connection_params.get('warehouse_keepalive', 0))
+        self._keepalive_task: Optional["asyncio.Task"] = None
         
+        # Connector arguments are fixed per tool, so build them once
+        try:
+            self._conn_kwargs = self._build_connection_params()
+        except KeyError as e:
+            raise DatabaseConnectionError(f"Missing Snowflake connection parameter: {e}")
+    
+    @property
+    def sql_dialect(self) -> str:
+        """Snowflake uses LIMIT syntax similar to other SQL databases."""
+        return "snowflake"
+    
     async def connect(self) -> None:
         """Establish Snowflake connection."""
-        if self._is_connected and self.connection:
+        if self._is_connected:
             return
         
         try:
-            # Build connection parameters
-            conn_params = self._build_connection_params()
-            
-            # Create connection in thread pool (Snowflake connector is not async)
-            loop = asyncio.get_event_loop()
-            self.connection = await loop.run_in_executor(
-                self.executor, 
-                lambda: snowflake.connector.connect(**conn_params)
-            )
-            
-            # Test connection
-            await loop.run_in_executor(
-                self.executor,
-                lambda: self.connection.cursor().execute("SELECT 1").fetchone()
-            )
+            # Opening the first pooled session validates the configuration
+            async with self._acquire() as conn:
+                if self._prewarm or self._prewarm_query:
+                    await self._run_blocking(self._warm_warehouse, conn)
             
             self._is_connected = True
             logger.info("Connected to Snowflake")
             
+            if self._keepalive_interval > 0 and self._keepalive_task is None:
+                self._keepalive_task = asyncio.create_task(self._keep_warehouse_warm())
+            
         except Exception as e:
             self._is_connected = False
             raise DatabaseConnectionError(f"Failed to connect to Snowflake: {str(e)}")
     
     async def disconnect(self) -> None:
         """Close Snowflake connection."""
-        if self.connection:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                self.executor,
-                self.connection.close
-            )
-            self.connection = None
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        
+        idle = list(self._pool)
+        self._pool.clear()
+        self._pool_open -= len(idle)
+        self._pool_generation += 1
+        
+        for conn, _ in idle:
+            try:
+                await self._run_blocking(conn.close)
+            except Exception as e:
+                logger.warning(f"Error closing Snowflake session: {str(e)}")
+        
         self._is_connected = False
         logger.info("Disconnected from Snowflake")
     
+    async def _run_blocking(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking connector call on the shared Snowflake thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(_shared_executor(), fn, *args)
+    
+    @staticmethod
+    def _classify(query: str) -> str:
+        """Classify a query as "large" (aggregations, joins, windows) or "small"."""
+        return "large" if _HEAVY_QUERY_RE.search(query) else "small"
+    
+    def _route(self, query: str, warehouse: Optional[str]) -> Tuple[Optional[str], bool]:
+        """
+        Pick the warehouse for a query when warehouse_map is configured.
+        
+        Returns:
+            Tuple of (warehouse to use, whether the query counts as heavy)
+        """
+        if not self._warehouse_map:
+            return warehouse, False
+        
+        query_class = self._classify(query)
+        if warehouse is None:
+            warehouse = self._warehouse_map.get(query_class)
+        return warehouse, query_class == "large"
+    
+    @asynccontextmanager
+    async def _acquire(self, warehouse: Optional[str] = None,
+                       heavy: bool = False) -> AsyncIterator[Any]:
+        """
+        Borrow a Snowflake session from the pool.
+        Idle sessions past idle_timeout are closed, ones idle past test_interval
+        are checked with SELECT 1, and new sessions are opened up to max_size.
+        
+        Args:
+            warehouse: Preferred warehouse; an idle session already using it is
+                picked first so no USE WAREHOUSE is needed
+            heavy: Hold one of the max_size - 1 slots reserved for heavy queries
+        
+        Yields:
+            An open snowflake.connector connection
+        """
+        if heavy:
+            if self._heavy_sem is None:
+                self._heavy_sem = asyncio.Semaphore(max(1, self.pool_config["max_size"] - 1))
+            await self._heavy_sem.acquire()
+            try:
+                async with self._acquire(warehouse) as conn:
+                    yield conn
+            finally:
+                self._heavy_sem.release()
+            return
+        
+        if self._pool_sem is None:
+            self._pool_sem = asyncio.Semaphore(self.pool_config["max_size"])
+        
+        try:
+            await asyncio.wait_for(self._pool_sem.acquire(), self.pool_config["pool_timeout"])
+        except asyncio.TimeoutError:
+            raise DatabaseConnectionError(
+                f"Timed out after {self.pool_config['pool_timeout']}s waiting for a Snowflake session"
+            )
+        
+        generation = self._pool_generation
+        conn = None
+        try:
+            conn = await self._checkout(warehouse)
+            yield conn
+        finally:
+            try:
+                if conn is not None:
+                    await self._checkin(conn, generation)
+            finally:
+                self._pool_sem.release()
+    
+    async def _checkout(self, warehouse: Optional[str] = None) -> Any:
+        """Take a usable idle session, or open a new one."""
+        wanted = warehouse or self.connection_params.get('warehouse')
+        for i in range(len(self._pool) - 1, -1, -1):
+            if self._session_state.get(id(self._pool[i][0]), {}).get("warehouse") == wanted:
+                # Move the matching session to the end so it is popped first
+                entry = self._pool[i]
+                del self._pool[i]
+                self._pool.append(entry)
+                break
+        
+        while self._pool:
+            conn, last_used = self._pool.pop()
+            idle_for = time.monotonic() - last_used
+            
+            if idle_for > self._idle_timeout or conn.is_closed():
+                await self._close_session(conn)
+                continue
+            
+            if idle_for > self._test_interval:
+                try:
+                    await self._run_blocking(self._ping, conn)
+                except Exception:
+                    await self._close_session(conn)
+                    continue
+            
+            return conn
+        
+        conn_params = self._conn_kwargs
+        conn = await self._run_blocking(lambda: snowflake.connector.connect(**conn_params))
+        self._pool_open += 1
+        
+        # Values the session was opened with, so matching queries skip ALTERs
+        session_params = conn_params['session_parameters']
+        self._session_state[id(conn)] = {
+            "warehouse": conn_params['warehouse'],
+            "timeout": session_params.get('STATEMENT_TIMEOUT_IN_SECONDS'),
+            "use_cache": session_params.get('USE_CACHED_RESULT'),
+            "query_tag": session_params.get('QUERY_TAG')
+        }
+        return conn
+    
+    async def _checkin(self, conn: Any, generation: int) -> None:
+        """Return a session to the pool, or close it if the pool was reset."""
+        if generation != self._pool_generation or conn.is_closed():
+            await self._close_session(conn)
+        else:
+            self._pool.append((conn, time.monotonic()))
+    
+    async def _close_session(self, conn: Any) -> None:
+        """Close a pooled session, ignoring errors from dead sessions."""
+        self._pool_open -= 1
+        self._session_state.pop(id(conn), None)
+        try:
+            await self._run_blocking(conn.close)
+        except Exception:
+            pass
+    
+    def _apply_session(self, conn: Any, cursor: Any, warehouse: Optional[str] = None,
+                       timeout: Optional[int] = None,
+                       use_cached_result: Optional[bool] = None,
+                       query_tag: Optional[str] = None) -> None:
+        """
+        Bring a session's warehouse, statement timeout, result-cache setting
+        and query tag to the requested values, sending only what changed.
+        Several changes go out as one multi-statement request.
+        Runs on the executor thread alongside the query.
+        
+        Args:
+            conn: Borrowed session
+            cursor: Cursor on that session
+            warehouse: Warehouse to use; None means the configured default
+            timeout: Statement timeout in seconds; None leaves it unchanged
+            use_cached_result: Result cache setting; None leaves it unchanged
+            query_tag: Query tag; None means the configured default, so a
+                fingerprint tag never sticks to later queries
+        """
+        state = self._session_state.setdefault(
+            id(conn), {"warehouse": None, "timeout": None, "use_cache": None}
+        )
+        wanted = {
+            "warehouse": warehouse or self.connection_params.get('warehouse'),
+            "query_tag": query_tag or self._conn_kwargs['session_parameters'].get('QUERY_TAG')
+        }
+        if timeout is not None:
+            wanted["timeout"] = timeout
+        if use_cached_result is not None:
+            wanted["use_cache"] = use_cached_result
+        
+        statements = []
+        if state["warehouse"] != wanted["warehouse"]:
+            statements.append(f"USE WAREHOUSE {wanted['warehouse']}")
+        if "timeout" in wanted and state["timeout"] != timeout:
+            statements.append(f"ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = {timeout}")
+        if "use_cache" in wanted and state["use_cache"] != use_cached_result:
+            statements.append(f"ALTER SESSION SET USE_CACHED_RESULT = {str(use_cached_result).upper()}")
+        if state.get("query_tag") != wanted["query_tag"]:
+            tag = str(wanted["query_tag"] or "").replace("'", "''")
+            statements.append(f"ALTER SESSION SET QUERY_TAG = '{tag}'")
+        
+        if len(statements) == 1:
+            cursor.execute(statements[0])
+        elif statements:
+            cursor.execute(";\n".join(statements), num_statements=len(statements))
+            while cursor.nextset():
+                pass
+        
+        state.update(wanted)
+    
+    @staticmethod
+    def _ping(conn: Any) -> None:
+        """Validate a session with a trivial query."""
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT 1").fetchone()
+        finally:
+            cursor.close()
+    
+    def _warm_warehouse(self, conn: Any) -> None:
+        """
+        Resume the warehouse and load its local cache before the first user query.
+        Prewarm failures are logged rather than failing the connection.
+        """
+        cursor = conn.cursor()
+        try:
+            if self._prewarm:
+                cursor.execute("SELECT SYSTEM$WAIT(0)", timeout=30).fetchall()
+            if self._prewarm_query:
+                cursor.execute(self._prewarm_query, timeout=30).fetchall()
+        except Exception as e:
+            logger.warning(f"Snowflake prewarm failed: {str(e)}")
+        finally:
+            cursor.close()
+    
+    async def _keep_warehouse_warm(self) -> None:
+        """Periodically run the prewarm query (or SELECT 1) while connected."""
+        while True:
+            await asyncio.sleep(self._keepalive_interval)
+            try:
+                async with self._acquire() as conn:
+                    await self._run_blocking(self._warm_warehouse if self._prewarm_query
+                                             else self._ping, conn)
+            except Exception as e:
+                logger.warning(f"Snowflake warehouse keepalive failed: {str(e)}")
+    
+    @staticmethod
+    def _fetch_all(cursor: Any, row_format: str = "dict") -> Tuple[Any, List[str]]:
+        """
+        Fetch all rows of an executed cursor in the requested shape.
+        Arrow-format results are decoded columnar and converted in one pass;
+        JSON-format results (e.g. SHOW commands) use the row-by-row path.
+        
+        Args:
+            cursor: Plain (non-Dict) cursor with an executed query
+            row_format: "dict" for dict rows, "tuple" for tuples, or "arrow"
+                for a pyarrow.Table (tuples when Arrow isn't available)
+        
+        Returns:
+            Tuple of (rows, column names)
+        """
+        columns = [desc[0] for desc in cursor.description] if cursor.description else []
+        
+        if row_format == "tuple":
+            return cursor.fetchall(), columns
+        
+        if PYARROW_AVAILABLE:
+            try:
+                table = cursor.fetch_arrow_all()
+            except NotSupportedError:
+                pass
+            else:
+                if row_format == "arrow":
+                    if table is None:
+                        table = pa.table({column: pa.array([], pa.null()) for column in columns})
+                    return table, columns
+                return (table.to_pylist() if table is not None else []), columns
+        
+        rows = cursor.fetchall()
+        if row_format == "arrow":
+            return rows, columns
+        return [dict(zip(columns, row)) for row in rows], columns
+    
+    def _format_results(self, rows: Union[List[Dict], List[Tuple], "pa.Table"], columns: List[str],
+                        format: str, raw_json: bool = False) -> Union[List[Dict], str, bytes]:
+        """
+        Format query results, accepting an Arrow table or tuple rows as well
+        as dict rows. CSV is written straight from the Arrow columns or tuples;
+        other formats convert to dict rows only where the base class needs them.
+        """
+        if PYARROW_AVAILABLE and isinstance(rows, pa.Table):
+            if format == "csv":
+                if rows.num_rows == 0:
+                    return ""
+                buffer = io.BytesIO()
+                pa_csv.write_csv(rows, buffer)
+                return buffer.getvalue().decode()
+            rows = rows.to_pylist()
+        elif rows and isinstance(rows[0], tuple):
+            if format == "table":
+                # The table renderer builds its frame from tuples directly
+                return self._create_ascii_table(rows, columns)
+            if format == "csv":
+                output = io.StringIO()
+                writer = csv.writer(output)
+                writer.writerow(columns)
+                writer.writerows(rows)
+                return output.getvalue()
+            rows = [dict(zip(columns, row)) for row in rows]
+        
+        return super()._format_results(rows, columns, format, raw_json)
+    
+    def pool_status(self) -> Dict[str, Any]:
+        """Report pool sizing plus open and idle session counts."""
+        return {
+            **super().pool_status(),
+            "open": self._pool_open,
+            "idle": len(self._pool),
+            "checked_out": self._pool_open - len(self._pool)
+        }
+    
     async def execute_query(self, query: str, timeout: int = 30, warehouse: str = None, 
-                          use_cached_result: bool = True) -> Tuple[List[Dict], List[str]]:
+                          use_cached_result: bool = True,
+                          row_format: str = "dict") -> Tuple[Any, List[str]]:
         """
         Execute SQL query against Snowflake.
         
@@ -130,44 +550,161 @@ class SnowflakeTool(BaseDatabaseTool):
             timeout: Query timeout in seconds
             warehouse: Warehouse to use (optional)
             use_cached_result: Whether to use cached results
+            row_format: "dict", "tuple" or "arrow"; see _fetch_all
             
         Returns:
-            Tuple of (rows as list of dicts, column names)
+            Tuple of (rows, column names)
         """
-        if not self._is_connected or not self.connection:
-            await self.connect()
+        warehouse, _ = self._route(query, warehouse)
+        cache_key = self._result_cache_key(query, warehouse)
+        if cache_key is None:
+            return await self._fetch_rows(query, timeout, warehouse, use_cached_result, row_format)
+        cache_key += (row_format,)
         
-        try:
-            loop = asyncio.get_event_loop()
+        caching = use_cached_result and self._result_cache_ttl > 0
+        if caching:
+            cached = self._get_cached_rows(cache_key)
+            if cached is not None:
+                return cached
+        
+        # Identical reads already running share one fetch, cache enabled or not
+        task = self._inflight_queries.get(cache_key)
+        if task is None:
+            if caching:
+                self._result_cache_stats["misses"] += 1
+            task = asyncio.ensure_future(
+                self._fetch_and_cache(cache_key, query, timeout, warehouse,
+                                      use_cached_result, row_format)
+            )
+            self._inflight_queries[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight_queries.pop(cache_key, None))
+        
+        return await asyncio.shield(task)
+    
+    def _result_cache_key(self, query: str, warehouse: Optional[str]) -> Optional[Tuple]:
+        """
+        Build the client-side cache key for a read-only, deterministic query.
+        The query text is used as-is; normalizing whitespace or case would also
+        change string literals and let different queries share a result.
+        
+        Returns:
+            Cache key tuple, or None if the query must not be cached
+        """
+        if not self._is_read_only(query) or _NONDETERMINISTIC_RE.search(query):
+            return None
+        
+        params = self.connection_params
+        return (
+            query,
+            warehouse or params.get('warehouse'),
+            params.get('database'),
+            params.get('schema'),
+            params.get('role')
+        )
+    
+    @staticmethod
+    def _is_read_only(query: str) -> bool:
+        """Whether a query starts with SELECT or WITH."""
+        head = query.lstrip()[:6].upper()
+        return head.startswith('SELECT') or head.startswith('WITH')
+    
+    def _get_cached_rows(self, key: Tuple) -> Optional[Tuple[List[Dict], List[str]]]:
+        """Return live cached rows for a key, dropping the entry if expired."""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        
+        if entry[0] <= time.monotonic():
+            del self._result_cache[key]
+            return None
+        
+        self._result_cache.move_to_end(key)
+        self._result_cache_stats["hits"] += 1
+        return entry[1]
+    
+    async def _fetch_and_cache(self, key: Tuple, query: str, timeout: int,
+                               warehouse: Optional[str], use_cached_result: bool,
+                               row_format: str) -> Tuple[Any, List[str]]:
+        """Fetch rows from Snowflake and store them under key if caching is on."""
+        result = await self._fetch_rows(query, timeout, warehouse, use_cached_result, row_format)
+        if self._result_cache_ttl <= 0:
+            return result
+        
+        self._result_cache[key] = (time.monotonic() + self._result_cache_ttl, result)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self._result_cache_size:
+            self._result_cache.popitem(last=False)
+            self._result_cache_stats["evictions"] += 1
+        
+        return result
+    
+    def invalidate_result_cache(self, pattern: str = None) -> int:
+        """
+        Drop cached query results.
+        
+        Args:
+            pattern: Regex matched against the query text (all if omitted)
             
-            def _execute():
-                cursor = self.connection.cursor(DictCursor)
+        Returns:
+            Number of entries removed
+        """
+        if pattern is None:
+            removed = len(self._result_cache)
+            self._result_cache.clear()
+            return removed
+        
+        matcher = re.compile(pattern, re.IGNORECASE)
+        keys = [key for key in self._result_cache if matcher.search(key[0])]
+        for key in keys:
+            del self._result_cache[key]
+        return len(keys)
+    
+    def result_cache_stats(self) -> Dict[str, int]:
+        """Hit, miss and eviction counts plus the current cache size."""
+        return {**self._result_cache_stats, "size": len(self._result_cache)}
+    
+    async def _fetch_rows(self, query: str, timeout: int, warehouse: Optional[str],
+                          use_cached_result: bool,
+                          row_format: str = "dict") -> Tuple[Any, List[str]]:
+        """Run a query on the Snowflake connection and fetch all rows."""
+        warehouse, heavy = self._route(query, warehouse)
+        await self._ensure_connected()
+        
+        # Deterministic reads get a fingerprint tag so later runs can find them
+        fingerprint = None
+        if self._result_reuse_hours > 0 and use_cached_result:
+            key = self._result_cache_key(query, warehouse)
+            if key is not None:
+                fingerprint = "mcp:" + hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+        
+        try:
+            def _execute(conn):
+                cursor = conn.cursor()
                 
                 try:
-                    # Set warehouse if specified
-                    if warehouse:
-                        cursor.execute(f"USE WAREHOUSE {warehouse}")
+                    # Warehouse, timeout, result cache setting and tag, if changed
+                    self._apply_session(conn, cursor, warehouse, timeout, use_cached_result,
+                                        fingerprint)
                     
-                    # Set query timeout
-                    cursor.execute(f"ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = {timeout}")
-                    
-                    # Set result cache setting
-                    cursor.execute(f"ALTER SESSION SET USE_CACHED_RESULT = {str(use_cached_result).upper()}")
+                    if fingerprint is not None:
+                        cursor.execute(_RESULT_REUSE_SQL, (fingerprint, query, self._result_reuse_hours))
+                        previous = cursor.fetchone()
+                        if previous:
+                            # Read the earlier run's result instead of re-planning the query
+                            cursor.execute("SELECT * FROM TABLE(RESULT_SCAN(%s))", (previous[0],))
+                            return self._fetch_all(cursor, row_format)
                     
                     # Execute the main query
                     cursor.execute(query)
                     
-                    # Fetch results
-                    rows = cursor.fetchall()
-                    columns = [desc[0] for desc in cursor.description] if cursor.description else []
-                    
-                    return rows, columns
+                    return self._fetch_all(cursor, row_format)
                     
                 finally:
                     cursor.close()
             
             # Execute in thread pool
-            rows, columns = await loop.run_in_executor(self.executor, _execute)
+            async with self._acquire(warehouse, heavy) as conn:
+                rows, columns = await self._run_blocking(_execute, conn)
             
             return rows, columns
             
@@ -176,7 +713,8 @@ class SnowflakeTool(BaseDatabaseTool):
     
     async def execute(self, query: str, limit: int = 100, format: str = "table", 
                      timeout: int = 30, warehouse: str = None, 
-                     use_cached_result: bool = True) -> Dict[str, Any]:
+                     use_cached_result: bool = True, raw_json: bool = False,
+                     **kwargs) -> Dict[str, Any]:
         """
         Execute database query with Snowflake-specific parameters.
         
@@ -187,34 +725,48 @@ class SnowflakeTool(BaseDatabaseTool):
             timeout: Query timeout in seconds
             warehouse: Warehouse to use (optional)
             use_cached_result: Whether to use cached results
+            raw_json: With format "json", return results as pre-serialized bytes
+            **kwargs: Options for other backends; ignored
             
         Returns:
             Dict containing query results and metadata
         """
         try:
             # Ensure connection
-            if not self._is_connected:
-                await self.connect()
+            await self._ensure_connected()
             
-            # Validate query
-            self._validate_query(query)
-            
-            # Add limit if not present
-            limited_query = self._apply_limit(query, limit)
+            # Validate query and add limit if not present
+            limited_query = self._prepare_query(query, limit)
             
             # Execute query
-            start_time = pd.Timestamp.now()
-            rows, columns = await self.execute_query(
-                limited_query, timeout, warehouse, use_cached_result
-            )
-            execution_time = (pd.Timestamp.now() - start_time).total_seconds()
-            
-            # Format results
-            formatted_results = self._format_results(rows, columns, format)
+            start_ns = time.perf_counter_ns()
+            if format == "csv" and limit > self.STREAM_THRESHOLD:
+                # Large exports are written batch by batch instead of held as dicts
+                row_count, columns, formatted_results = await self._stream_csv(
+                    limited_query, timeout,
+                    warehouse=warehouse, use_cached_result=use_cached_result
+                )
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+            else:
+                # Only JSON needs dict rows; skip building them for csv/table
+                if format == "csv" and PYARROW_AVAILABLE:
+                    row_format = "arrow"
+                elif format in ("csv", "table"):
+                    row_format = "tuple"
+                else:
+                    row_format = "dict"
+                rows, columns = await self.execute_query(
+                    limited_query, timeout, warehouse, use_cached_result, row_format
+                )
+                execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+                row_count = len(rows)
+                
+                # Format results
+                formatted_results = self._format_results(rows, columns, format, raw_json)
             
             return {
                 "query": limited_query,
-                "row_count": len(rows),
+                "row_count": row_count,
                 "columns": columns,
                 "execution_time_seconds": execution_time,
                 "results": formatted_results,
@@ -231,70 +783,217 @@ class SnowflakeTool(BaseDatabaseTool):
             logger.error(f"Snowflake query failed: {str(e)}")
             raise DatabaseQueryError(f"Query execution failed: {str(e)}")
     
-    async def get_schema_info(self) -> Dict[str, Any]:
-        """Get Snowflake database schema information."""
-        if not self._is_connected or not self.connection:
-            await self.connect()
+    async def stream_query(self, query: str, timeout: int = 30, warehouse: str = None,
+                           use_cached_result: bool = True,
+                           batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute SQL query and yield rows as they are fetched in batches.
+        The pooled session is held until the iterator is exhausted.
         
-        try:
-            loop = asyncio.get_event_loop()
+        Args:
+            query: SQL query to execute
+            timeout: Query timeout in seconds
+            warehouse: Warehouse to use (optional)
+            use_cached_result: Whether to use cached results
+            batch_size: Rows fetched per executor call
             
-            def _get_schema_info():
-                cursor = self.connection.cursor(DictCursor)
-                
+        Yields:
+            Rows as dicts
+        """
+        warehouse, heavy = self._route(query, warehouse)
+        await self._ensure_connected()
+        
+        try:
+            async with self._acquire(warehouse, heavy) as conn:
+                cursor = conn.cursor()
                 try:
-                    schema_info = {
-                        "database_type": "snowflake",
-                        "databases": [],
-                        "schemas": {},
-                        "tables": {},
-                        "views": {}
-                    }
-                    
-                    # Get databases
-                    cursor.execute("SHOW DATABASES")
-                    databases = cursor.fetchall()
-                    schema_info["databases"] = [db["name"] for db in databases]
-                    
-                    # Get schemas for current database
-                    cursor.execute("SHOW SCHEMAS")
-                    schemas = cursor.fetchall()
-                    current_db = self.connection_params.get('database')
-                    schema_info["schemas"][current_db] = [schema["name"] for schema in schemas]
+                    def _start():
+                        self._apply_session(conn, cursor, warehouse, timeout, use_cached_result)
+                        cursor.execute(query)
+                        return [desc[0] for desc in cursor.description] if cursor.description else []
                     
-                    # Get tables and views
-                    cursor.execute("SHOW TABLES")
-                    tables = cursor.fetchall()
-                    
-                    cursor.execute("SHOW VIEWS")
-                    views = cursor.fetchall()
-                    
-                    # Organize by schema
-                    for table in tables:
-                        schema_name = table["schema_name"]
-                        if schema_name not in schema_info["tables"]:
-                            schema_info["tables"][schema_name] = []
-                        schema_info["tables"][schema_name].append(table["name"])
-                    
-                    for view in views:
-                        schema_name = view["schema_name"]
-                        if schema_name not in schema_info["views"]:
-                            schema_info["views"][schema_name] = []
-                        schema_info["views"][schema_name].append(view["name"])
-                    
-                    return schema_info
+                    columns = await self._run_blocking(_start)
                     
+                    while True:
+                        batch = await self._run_blocking(cursor.fetchmany, batch_size)
+                        if not batch:
+                            break
+                        for row in batch:
+                            yield dict(zip(columns, row))
                 finally:
                     cursor.close()
+                    
+        except Exception as e:
+            raise DatabaseQueryError(f"Snowflake query execution failed: {str(e)}")
+    
+    async def execute_arrow(self, query: str, timeout: int = 30, warehouse: str = None,
+                            use_cached_result: bool = True) -> "pa.Table":
+        """
+        Execute SQL query and fetch the result as a single Arrow table.
+        The connector builds the table from Snowflake's Arrow result chunks,
+        so no per-row Python objects are created. Goes through execute_query,
+        so the result cache, shared in-flight fetches and RESULT_SCAN reuse apply.
+        
+        Args:
+            query: SQL query to execute (limit already applied)
+            timeout: Query timeout in seconds
+            warehouse: Warehouse to use (optional)
+            use_cached_result: Whether to use cached results
+            
+        Returns:
+            pyarrow.Table with the query results
+        """
+        if not PYARROW_AVAILABLE:
+            raise DatabaseQueryError("pyarrow is required for Arrow results")
+        
+        rows, columns = await self.execute_query(query, timeout, warehouse, use_cached_result, "arrow")
+        if isinstance(rows, pa.Table):
+            return rows
+        
+        # JSON-format results (e.g. SHOW commands) come back as tuples
+        if rows:
+            arrays = [pa.array(list(column)) for column in zip(*rows)]
+        else:
+            arrays = [pa.array([], pa.null()) for _ in columns]
+        return pa.Table.from_arrays(arrays, names=columns)
+    
+    async def execute_batch(self, queries: List[Tuple[str, int, str]],
+                            timeout: int = 30) -> List[Dict[str, Any]]:
+        """
+        Execute several queries in one multi-statement request.
+        
+        Args:
+            queries: List of (query, limit, format) tuples
+            timeout: Timeout in seconds for the whole batch
             
-            return await loop.run_in_executor(self.executor, _get_schema_info)
+        Returns:
+            One result dict per query, shaped like execute() output
+        """
+        await self._ensure_connected()
+        
+        limited_queries = [self._prepare_query(query, limit) for query, limit, _ in queries]
+        batch_sql = ";\n".join(query.rstrip().rstrip(';') for query in limited_queries)
+        
+        def _execute(conn):
+            cursor = conn.cursor(DictCursor)
             
+            try:
+                self._apply_session(conn, cursor, timeout=timeout)
+                cursor.execute(batch_sql, num_statements=len(limited_queries))
+                
+                # Each statement's result set follows the previous one
+                result_sets = []
+                while True:
+                    rows = cursor.fetchall()
+                    columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                    result_sets.append((rows, columns))
+                    if not cursor.nextset():
+                        break
+                
+                return result_sets
+                
+            finally:
+                cursor.close()
+        
+        try:
+            start_ns = time.perf_counter_ns()
+            async with self._acquire() as conn:
+                result_sets = await self._run_blocking(_execute, conn)
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+        except Exception as e:
+            raise DatabaseQueryError(f"Snowflake batch execution failed: {str(e)}")
+        
+        if len(result_sets) != len(limited_queries):
+            raise DatabaseQueryError(
+                f"Snowflake batch returned {len(result_sets)} result sets for {len(limited_queries)} queries"
+            )
+        
+        return [
+            {
+                "query": limited_query,
+                "row_count": len(rows),
+                "columns": columns,
+                "execution_time_seconds": execution_time,
+                "results": self._format_results(rows, columns, format),
+                "metadata": {
+                    "database_type": self.name,
+                    "limit_applied": limit,
+                    "format": format,
+                    "batched": True
+                }
+            }
+            for limited_query, (_, limit, format), (rows, columns)
+            in zip(limited_queries, queries, result_sets)
+        ]
+    
+    async def get_schema_info(self, level: int = 2) -> Dict[str, Any]:
+        """
+        Get Snowflake database schema information.
+        
+        Args:
+            level: 1 for databases and schemas only, 2 to add tables and
+                views, 3 to also add each table's columns and row count
+        """
+        await self._ensure_connected()
+        
+        lookups = [self._run_show("SHOW DATABASES"), self._run_show("SHOW SCHEMAS")]
+        if level >= 2:
+            # Tables and views in one metadata query instead of two SHOWs
+            lookups.append(self._run_show(
+                "SELECT table_schema, table_name, table_type "
+                "FROM information_schema.tables "
+                "WHERE table_schema <> 'INFORMATION_SCHEMA'"
+            ))
+        
+        try:
+            # Independent SHOW commands run concurrently on separate pooled sessions
+            databases, schemas, *relations = await asyncio.gather(*lookups)
         except Exception as e:
             raise DatabaseQueryError(f"Failed to retrieve Snowflake schema info: {str(e)}")
+        
+        current_db = self.connection_params.get('database')
+        schema_info = {
+            "database_type": "snowflake",
+            "databases": [db["name"] for db in databases],
+            "schemas": {current_db: [schema["name"] for schema in schemas]}
+        }
+        if level < 2:
+            return schema_info
+        
+        # Organize by schema, splitting views from tables on TABLE_TYPE
+        grouped = {"tables": defaultdict(list), "views": defaultdict(list)}
+        for relation in relations[0]:
+            kind = "views" if "VIEW" in relation["TABLE_TYPE"] else "tables"
+            grouped[kind][relation["TABLE_SCHEMA"]].append(relation["TABLE_NAME"])
+        
+        schema_info["tables"] = dict(grouped["tables"])
+        schema_info["views"] = dict(grouped["views"])
+        
+        if level >= 3:
+            schema_info["table_info"] = await self._describe_tables(
+                [(schema_name, table_name)
+                 for schema_name, table_names in schema_info["tables"].items()
+                 for table_name in table_names]
+            )
+        
+        return schema_info
+    
+    async def _run_show(self, sql: str, params: Tuple = None) -> List[Dict]:
+        """Run one metadata command on its own pooled session."""
+        def _show(conn):
+            cursor = conn.cursor(DictCursor)
+            try:
+                cursor.execute(sql, params)
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+        
+        async with self._acquire() as conn:
+            return await self._run_blocking(_show, conn)
     
     def _build_connection_params(self) -> Dict[str, Any]:
         """Build Snowflake connection parameters."""
-        params = self.connection_params.copy()
+        params = self.connection_params
         
         # Required parameters
         conn_params = {
@@ -321,26 +1020,19 @@ class SnowflakeTool(BaseDatabaseTool):
         if 'authenticator' in params:
             conn_params['authenticator'] = params['authenticator']
         
-        # Session parameters
-        session_params = params.get('session_parameters', {})
-        if session_params:
-            conn_params['session_parameters'] = session_params
+        # Heartbeats keep idle pooled sessions from expiring between bursts
+        conn_params['client_session_keep_alive'] = params.get('client_session_keep_alive', True)
         
-        return conn_params
-    
-    def _apply_limit(self, query: str, limit: int) -> str:
-        """
-        Apply LIMIT clause to Snowflake query if not already present.
-        Snowflake uses LIMIT syntax similar to other SQL databases.
-        """
-        query_upper = query.upper()
-        
-        # Check if LIMIT already exists
-        if 'LIMIT' in query_upper:
-            return query
+        # Session parameters; Arrow results let the fetch paths skip per-row decoding
+        session_params = dict(params.get('session_parameters', {}))
+        session_params.setdefault('PYTHON_CONNECTOR_QUERY_RESULT_FORMAT', 'ARROW')
+        # Defaults matching execute(), so typical queries need no ALTER SESSION
+        session_params.setdefault('STATEMENT_TIMEOUT_IN_SECONDS', 30)
+        session_params.setdefault('USE_CACHED_RESULT', True)
+        session_params.setdefault('QUERY_TAG', params.get('query_tag', 'mcp_server'))
+        conn_params['session_parameters'] = session_params
         
-        # Add LIMIT clause
-        return f"{query.rstrip(';')} LIMIT {limit}"
+        return conn_params
     
     async def get_warehouse_info(self) -> Dict[str, Any]:
         """
@@ -349,37 +1041,37 @@ class SnowflakeTool(BaseDatabaseTool):
         Returns:
             Dict with warehouse information
         """
-        if not self._is_connected or not self.connection:
-            await self.connect()
+        return await self._cached_metadata("warehouses", self._load_warehouse_info)
+    
+    async def _load_warehouse_info(self) -> Dict[str, Any]:
+        """Fetch warehouse information with SHOW WAREHOUSES."""
+        await self._ensure_connected()
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _get_warehouses():
-                cursor = self.connection.cursor(DictCursor)
+            def _get_warehouses(conn):
+                cursor = conn.cursor(DictCursor)
                 
                 try:
                     cursor.execute("SHOW WAREHOUSES")
-                    warehouses = cursor.fetchall()
                     
-                    warehouse_info = []
-                    for wh in warehouses:
-                        warehouse_info.append({
+                    return {"warehouses": [
+                        {
                             "name": wh["name"],
                             "state": wh["state"],
                             "type": wh["type"],
                             "size": wh["size"],
                             "auto_suspend": wh["auto_suspend"],
                             "auto_resume": wh["auto_resume"],
-                            "comment": wh.get("comment", "")
-                        })
-                    
-                    return {"warehouses": warehouse_info}
+                            "comment": wh.get("comment") or ""
+                        }
+                        for wh in cursor.fetchall()
+                    ]}
                     
                 finally:
                     cursor.close()
             
-            return await loop.run_in_executor(self.executor, _get_warehouses)
+            async with self._acquire() as conn:
+                return await self._run_blocking(_get_warehouses, conn)
             
         except Exception as e:
             raise DatabaseQueryError(f"Failed to get warehouse info: {str(e)}")
@@ -395,30 +1087,47 @@ class SnowflakeTool(BaseDatabaseTool):
         Returns:
             Dict with table information
         """
-        if not self._is_connected or not self.connection:
-            await self.connect()
+        return await self._cached_metadata(
+            f"table:{schema_name}.{table_name}",
+            lambda: self._load_table_info(table_name, schema_name)
+        )
+    
+    async def _load_table_info(self, table_name: str, schema_name: str = None) -> Dict[str, Any]:
+        """Fetch a table's columns and row count."""
+        for identifier in (table_name, schema_name):
+            if identifier is not None and not _IDENTIFIER_RE.match(identifier):
+                raise DatabaseQueryError(f"Invalid identifier: {identifier}")
+        
+        # Qualify rather than USE SCHEMA so pooled sessions keep their schema
+        qualified_name = f"{schema_name}.{table_name}" if schema_name else table_name
+        
+        # Unquoted identifiers are stored upper-cased in INFORMATION_SCHEMA
+        parts = qualified_name.upper().split('.')
+        info_table_name = parts[-1]
+        info_schema_name = parts[-2] if len(parts) > 1 else None
+        info_schema = f"{parts[-3]}.information_schema" if len(parts) > 2 else "information_schema"
+        
+        await self._ensure_connected()
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _get_table_info():
-                cursor = self.connection.cursor(DictCursor)
+            def _get_table_info(conn):
+                cursor = conn.cursor(DictCursor)
                 
                 try:
-                    # Use specified schema or current schema
-                    if schema_name:
-                        cursor.execute(f"USE SCHEMA {schema_name}")
-                    
-                    # Get table details
-                    cursor.execute(f"DESCRIBE TABLE {table_name}")
+                    # Get table details; the statement text is the same for every table
+                    cursor.execute("DESCRIBE TABLE IDENTIFIER(%s)", (qualified_name,))
                     columns = cursor.fetchall()
                     
-                    # Get table stats
+                    # Row count from table metadata, so no warehouse scan is needed
                     try:
-                        cursor.execute(f"SELECT COUNT(*) as row_count FROM {table_name}")
+                        cursor.execute(
+                            f"SELECT row_count FROM {info_schema}.tables "
+                            "WHERE table_schema = COALESCE(%s, CURRENT_SCHEMA()) AND table_name = %s",
+                            (info_schema_name, info_table_name)
+                        )
                         row_count_result = cursor.fetchone()
                         row_count = row_count_result["ROW_COUNT"] if row_count_result else None
-                    except:
+                    except Exception:
                         row_count = None
                     
                     table_info = {
@@ -443,7 +1152,8 @@ class SnowflakeTool(BaseDatabaseTool):
                 finally:
                     cursor.close()
             
-            return await loop.run_in_executor(self.executor, _get_table_info)
+            async with self._acquire() as conn:
+                return await self._run_blocking(_get_table_info, conn)
             
         except Exception as e:
             raise DatabaseQueryError(f"Failed to get table info: {str(e)}")
@@ -459,26 +1169,33 @@ class SnowflakeTool(BaseDatabaseTool):
         Returns:
             pandas DataFrame with query results
         """
-        if not self._is_connected or not self.connection:
-            await self.connect()
+        await self._ensure_connected()
+        
+        # Apply limit
+        limited_query = self._apply_limit(query, limit)
         
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _execute_df():
-                # Apply limit
-                limited_query = self._apply_limit(query, limit)
-                
-                # Use pandas integration
-                df = pd.read_sql(limited_query, self.connection)
-                return df
+            def _execute_df(conn):
+                # Build the DataFrame straight from the Arrow result chunks
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(limited_query)
+                    try:
+                        if limit > self.STREAM_THRESHOLD:
+                            # One frame per result chunk, joined once at the end
+                            batches = list(cursor.fetch_pandas_batches())
+                            if batches:
+                                return pd.concat(batches, ignore_index=True)
+                        return cursor.fetch_pandas_all()
+                    except NotSupportedError:
+                        # JSON-format results (e.g. SHOW commands) have no Arrow path
+                        columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                        return pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+                finally:
+                    cursor.close()
             
-            return await loop.run_in_executor(self.executor, _execute_df)
+            async with self._acquire() as conn:
+                return await self._run_blocking(_execute_df, conn)
             
         except Exception as e:
             raise DatabaseQueryError(f"DataFrame query execution failed: {str(e)}")
-    
-    def __del__(self):
-        """Cleanup executor on deletion."""
-        if hasattr(self, 'executor'):
-            self.executor.shutdown(wait=False)
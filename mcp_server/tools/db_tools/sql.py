@@ -4,7 +4,12 @@ Supports PostgreSQL, MySQL, SQLite, and other SQL databases via SQLAlchemy.
 """
 
 import asyncio
-from typing import Dict, Any, List, Tuple, Optional
+import functools
+import itertools
+import re
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Dict, Any, Iterable, List, Sequence, Tuple, Optional
 import logging
 from urllib.parse import quote_plus
 
@@ -34,15 +39,323 @@ try:
 except ImportError:
     SQLALCHEMY_AVAILABLE = False
 
-from .base import BaseDatabaseTool, DatabaseConnectionError, DatabaseQueryError
+if TYPE_CHECKING:
+    from sqlalchemy import TextClause
+
+from .base import BaseDatabaseTool, DatabaseConnectionError, DatabaseQueryError, PYARROW_AVAILABLE
+
+if PYARROW_AVAILABLE:
+    import pyarrow as pa
 
 logger = logging.getLogger("mcp_server.tools.database.sql")
 
+# Column listings; table and schema names are bound, never interpolated
+_COLUMNS_SQL = """
+    SELECT column_name, data_type, is_nullable, column_default
+    FROM information_schema.columns
+    WHERE table_name = :table
+    ORDER BY ordinal_position
+"""
+_COLUMNS_IN_SCHEMA_SQL = """
+    SELECT column_name, data_type, is_nullable, column_default
+    FROM information_schema.columns
+    WHERE table_name = :table AND table_schema = :schema
+    ORDER BY ordinal_position
+"""
+
+# Names that may be interpolated (quoted) where a statement can't bind them
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(sql: str) -> "TextClause":
+    """Build (and reuse) the TextClause for a SQL string."""
+    return text(sql)
+
+
+def _postgresql_connect_args(params: Dict[str, Any], statement_timeout: int) -> Dict[str, Any]:
+    """asyncpg connect() arguments."""
+    connect_args = {
+        # Applied once per connection instead of SET before every query
+        'server_settings': {
+            'statement_timeout': str(statement_timeout * 1000),
+            'application_name': params.get('application_name', 'mcp_server')
+        }
+    }
+    # Prepared statements reused per connection: SQLAlchemy's adapter
+    # cache and asyncpg's own statement cache
+    cache_size = int(params.get('statement_cache_size', 500))
+    connect_args['prepared_statement_cache_size'] = cache_size
+    connect_args['statement_cache_size'] = cache_size
+    if params.get('ssl_mode'):
+        connect_args['sslmode'] = params['ssl_mode']
+    # connection_timeout predates command_timeout and still sets it
+    command_timeout = params.get('command_timeout', params.get('connection_timeout'))
+    if command_timeout:
+        connect_args['command_timeout'] = float(command_timeout)
+    return connect_args
+
+
+def _mysql_connect_args(params: Dict[str, Any], statement_timeout: int) -> Dict[str, Any]:
+    """aiomysql connect() arguments."""
+    connect_args = {
+        'init_command': _MYSQL.timeout_sql.format(ms=statement_timeout * 1000),
+        'charset': params.get('charset') or 'utf8mb4'
+    }
+    if params.get('connection_timeout'):
+        connect_args['connect_timeout'] = params['connection_timeout']
+    return connect_args
+
+
+def _sqlite_connect_args(params: Dict[str, Any], statement_timeout: int) -> Dict[str, Any]:
+    """aiosqlite connect() arguments."""
+    if params.get('connection_timeout'):
+        return {'timeout': params['connection_timeout']}
+    return {}
+
+
+class _Driver:
+    """
+    Everything that differs between SQL database types.
+    
+    SQLDatabaseTool picks one in __init__, so its methods read attributes
+    here instead of branching on database_type; supporting another database
+    means adding an instance to _DRIVERS.
+    """
+    
+    __slots__ = ('display_name', 'url_scheme', 'default_port', 'default_username',
+                 'package', 'available', 'connect_args', 'metadata', 'timeout_sql', 'timeout_is_local',
+                 'has_schemas', 'pooled', 'copy_records')
+    
+    def __init__(self, display_name: str, url_scheme: str, package: str, available: bool,
+                 connect_args: Callable[[Dict[str, Any], int], Dict[str, Any]],
+                 metadata: Dict[str, str], default_port: int = None,
+                 default_username: str = None, timeout_sql: str = None,
+                 timeout_is_local: bool = False, has_schemas: bool = True,
+                 pooled: bool = True, copy_records: bool = False):
+        """
+        Initialize a driver description.
+        
+        Args:
+            display_name: Name used in messages, e.g. 'PostgreSQL'
+            url_scheme: SQLAlchemy URL scheme, e.g. 'postgresql+asyncpg'
+            package: pip package providing the async driver
+            available: Whether that package imported
+            connect_args: Builds driver connect() arguments from
+                (connection_params, statement_timeout)
+            metadata: Catalog queries: schemas, tables, columns,
+                columns_in_schema, row_estimate (optional) and objects
+            default_port: Port used when connection_params has none
+            default_username: Username used when connection_params has none
+            timeout_sql: Statement setting the query timeout, formatted with ms
+                (None when the database has no server-side timeout)
+            timeout_is_local: Whether timeout_sql ends with the transaction
+            has_schemas: Whether the database has schemas (SQLite doesn't)
+            pooled: Whether connections go through a sized pool
+            copy_records: Whether bulk inserts can use asyncpg's COPY
+        """
+        self.display_name = display_name
+        self.url_scheme = url_scheme
+        self.default_port = default_port
+        self.default_username = default_username
+        self.package = package
+        self.available = available
+        self.connect_args = connect_args
+        self.metadata = metadata
+        self.timeout_sql = timeout_sql
+        self.timeout_is_local = timeout_is_local
+        self.has_schemas = has_schemas
+        self.pooled = pooled
+        self.copy_records = copy_records
+
+
+# Catalog queries are kept constant so _compile always finds them cached.
+# row_estimate reads catalog statistics instead of scanning.
+_POSTGRESQL = _Driver(
+    display_name='PostgreSQL',
+    url_scheme='postgresql+asyncpg',
+    package='asyncpg',
+    available=ASYNCPG_AVAILABLE,
+    connect_args=_postgresql_connect_args,
+    metadata={
+        'schemas': """
+            SELECT schema_name 
+            FROM information_schema.schemata 
+            WHERE schema_name NOT IN ('information_schema', 'pg_catalog', 'pg_toast')
+        """,
+        'tables': """
+            SELECT table_schema, table_name, table_type
+            FROM information_schema.tables
+            WHERE table_schema NOT IN ('information_schema', 'pg_catalog')
+            ORDER BY table_schema, table_name
+        """,
+        'columns': _COLUMNS_SQL,
+        'columns_in_schema': _COLUMNS_IN_SCHEMA_SQL,
+        'row_estimate': """
+            SELECT CAST(c.reltuples AS bigint)
+            FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE c.relname = :table AND n.nspname = COALESCE(:schema, current_schema())
+        """
+    },
+    default_port=5432,
+    default_username='postgres',
+    # SET LOCAL ends with the transaction
+    timeout_sql="SET LOCAL statement_timeout = {ms}",
+    timeout_is_local=True,
+    copy_records=True
+)
+
+_MYSQL = _Driver(
+    display_name='MySQL',
+    url_scheme='mysql+aiomysql',
+    package='aiomysql',
+    available=AIOMYSQL_AVAILABLE,
+    connect_args=_mysql_connect_args,
+    metadata={
+        'schemas': "SHOW DATABASES",
+        'tables': """
+            SELECT table_schema, table_name, table_type
+            FROM information_schema.tables
+            WHERE table_schema NOT IN ('information_schema', 'mysql', 'performance_schema', 'sys')
+            ORDER BY table_schema, table_name
+        """,
+        'columns': _COLUMNS_SQL,
+        'columns_in_schema': _COLUMNS_IN_SCHEMA_SQL,
+        'row_estimate': (
+            "SELECT table_rows FROM information_schema.tables "
+            "WHERE table_schema = COALESCE(:schema, DATABASE()) AND table_name = :table"
+        )
+    },
+    default_port=3306,
+    default_username='root',
+    # MySQL has no transaction-scoped form; callers restore it afterwards
+    timeout_sql="SET SESSION max_execution_time = {ms}"
+)
+
+_SQLITE = _Driver(
+    display_name='SQLite',
+    url_scheme='sqlite+aiosqlite',
+    package='aiosqlite',
+    available=AIOSQLITE_AVAILABLE,
+    connect_args=_sqlite_connect_args,
+    metadata={
+        'objects': """
+            SELECT name, type 
+            FROM sqlite_master 
+            WHERE type IN ('table', 'view')
+            ORDER BY name
+        """,
+        # Same column shape as information_schema.columns
+        'columns': """
+            SELECT name, type, CASE WHEN "notnull" THEN 'NO' ELSE 'YES' END, dflt_value
+            FROM pragma_table_info(:table)
+        """
+    },
+    has_schemas=False,
+    # Connections are local file handles; keep SQLAlchemy's default pool
+    pooled=False
+)
+
+_DRIVERS: Dict[str, _Driver] = {
+    'postgresql': _POSTGRESQL,
+    'mysql': _MYSQL,
+    'sqlite': _SQLITE
+}
+
+
+class AsyncInsertBuffer:
+    """
+    Groups single-row inserts per (table, columns) and writes them in batches.
+    
+    A batch is flushed once it reaches max_rows, and a background task
+    flushes whatever is pending every max_wait_ms, so a row waits at most
+    about that long before it is written. The background task stops while
+    nothing is pending.
+    """
+    
+    __slots__ = ('_insert', '_max_rows', '_max_wait', '_pending', '_flusher', '_flushes')
+    
+    def __init__(self, insert: Callable[[str, List[str], List[Sequence[Any]]], Awaitable[int]],
+                 max_rows: int = 100000, max_wait_ms: int = 200):
+        """
+        Initialize the buffer.
+        
+        Args:
+            insert: Coroutine function writing (table, columns, rows), e.g. bulk_insert
+            max_rows: Pending rows per key that trigger an immediate flush
+            max_wait_ms: Interval between background flushes in milliseconds
+        """
+        self._insert = insert
+        self._max_rows = max_rows
+        self._max_wait = max_wait_ms / 1000
+        self._pending: Dict[Tuple[str, Tuple[str, ...]], List[Sequence[Any]]] = defaultdict(list)
+        self._flusher: Optional[asyncio.Task] = None
+        # Flushes still running; close() waits for them
+        self._flushes: set = set()
+    
+    def enqueue(self, table_name: str, columns: List[str], row: Sequence[Any]) -> None:
+        """Queue one row; must be called from a running event loop."""
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._run())
+        
+        key = (table_name, tuple(columns))
+        pending = self._pending[key]
+        pending.append(row)
+        
+        if len(pending) >= self._max_rows:
+            self._spawn(self._flush(key))
+    
+    async def flush(self) -> None:
+        """Write every pending batch now."""
+        await asyncio.gather(*(self._flush(key) for key in list(self._pending)))
+    
+    async def close(self) -> None:
+        """Stop the background task and write what is still pending."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            self._flusher = None
+        
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+        await self.flush()
+    
+    def _spawn(self, flush: Awaitable[None]) -> "asyncio.Task":
+        """Run a flush as a tracked task."""
+        task = asyncio.ensure_future(flush)
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+        return task
+    
+    async def _run(self) -> None:
+        """Flush pending rows every max_wait_ms; exits once nothing is pending."""
+        while self._pending:
+            await asyncio.sleep(self._max_wait)
+            # Shielded so close() cancelling this loop can't drop rows mid-write
+            await asyncio.shield(self._spawn(self.flush()))
+        
+        # The next enqueue starts a new flusher
+        self._flusher = None
+    
+    async def _flush(self, key: Tuple[str, Tuple[str, ...]]) -> None:
+        """Write one key's pending rows; failures are logged, not raised."""
+        rows = self._pending.pop(key, None)
+        if not rows:
+            return
+        
+        table_name, columns = key
+        try:
+            await self._insert(table_name, list(columns), rows)
+        except Exception as e:
+            logger.error(f"Buffered insert of {len(rows)} rows into {table_name} failed: {str(e)}")
+
+
 class SQLDatabaseTool(BaseDatabaseTool):
     """
     Tool for connecting to SQL databases (PostgreSQL, MySQL, SQLite, etc.)
     """
     
+    __slots__ = ('database_type', 'engine', 'metadata', '_driver', '_statement_timeout', '_insert_buffer')
+    
     def __init__(self, connection_params: Dict[str, Any]):
         """
         Initialize SQL database tool.
@@ -60,6 +373,23 @@ class SQLDatabaseTool(BaseDatabaseTool):
                 - schema: Default schema name
                 - ssl_mode: SSL mode for connection
                 - connection_timeout: Connection timeout in seconds
+                - min_size: Minimum pooled connections (default 1)
+                - max_size: Maximum pooled connections (default max_connections, pool_size or 5)
+                - pool_timeout: Seconds to wait for a pooled connection (default 30)
+                - pool_recycle: Seconds before a pooled connection is replaced (default 3600)
+                - pool_pre_ping: Check connections on checkout (default True); safe to
+                  turn off when pool_recycle is below the server's idle timeout
+                - application_name: Name reported to PostgreSQL (default mcp_server)
+                - command_timeout: Driver-level statement timeout in seconds (PostgreSQL)
+                - statement_timeout: Server-side query timeout in seconds set when
+                  each connection opens (default 30); queries asking for another
+                  timeout set it per transaction instead
+                - insert_buffer_rows: Rows per table that trigger a buffered
+                  insert flush (default 100000); see insert_async
+                - statement_cache_size: Prepared statements cached per
+                  PostgreSQL connection (default 500, 0 disables)
+                - insert_buffer_ms: Longest a buffered row waits before it is
+                  written, in milliseconds (default 200)
         """
         if not SQLALCHEMY_AVAILABLE:
             raise ImportError(
@@ -69,21 +399,15 @@ class SQLDatabaseTool(BaseDatabaseTool):
         
         db_type = connection_params.get('database_type', 'postgresql').lower()
         
+        driver = _DRIVERS.get(db_type)
+        if driver is None:
+            raise ValueError(f"Unsupported database type: {db_type}")
+        
         # Check specific database driver availability
-        if db_type == 'postgresql' and not ASYNCPG_AVAILABLE:
+        if not driver.available:
             raise ImportError(
-                "PostgreSQL driver not available. "
-                "Install with: pip install asyncpg"
-            )
-        elif db_type == 'mysql' and not AIOMYSQL_AVAILABLE:
-            raise ImportError(
-                "MySQL driver not available. "
-                "Install with: pip install aiomysql"
-            )
-        elif db_type == 'sqlite' and not AIOSQLITE_AVAILABLE:
-            raise ImportError(
-                "SQLite driver not available. "
-                "Install with: pip install aiosqlite"
+                f"{driver.display_name} driver not available. "
+                f"Install with: pip install {driver.package}"
             )
         super().__init__(
             name=f"sql_database_{db_type}",
@@ -92,8 +416,12 @@ class SQLDatabaseTool(BaseDatabaseTool):
         )
         
         self.database_type = db_type
+        self._driver = driver
         self.engine = None
         self.metadata = None
+        self._statement_timeout = int(connection_params.get('statement_timeout', 30))
+        # Created by the first insert_async call
+        self._insert_buffer: Optional[AsyncInsertBuffer] = None
         
     async def connect(self) -> None:
         """Establish database connection."""
@@ -103,18 +431,16 @@ class SQLDatabaseTool(BaseDatabaseTool):
         try:
             connection_string = self._build_connection_string()
             
-            # Create async engine
+            # Create async engine; queries check connections out of its pool
             self.engine = create_async_engine(
                 connection_string,
                 echo=False,
-                pool_pre_ping=True,
-                pool_recycle=3600,
-                connect_args=self._get_connect_args()
+                connect_args=self._get_connect_args(),
+                **self._get_pool_args()
             )
             
-            # Test connection
-            async with self.engine.begin() as conn:
-                await conn.execute(text("SELECT 1"))
+            # Opening the pool's first connections also tests the configuration
+            await self._fill_pool()
             
             self._is_connected = True
             logger.info(f"Connected to {self.database_type} database")
@@ -123,8 +449,35 @@ class SQLDatabaseTool(BaseDatabaseTool):
             self._is_connected = False
             raise DatabaseConnectionError(f"Failed to connect to {self.database_type}: {str(e)}")
     
+    async def _fill_pool(self) -> None:
+        """Open min_size pooled connections so early queries skip the handshake."""
+        # SQLite connections are local file handles; one is enough to test the file
+        count = max(self.pool_config["min_size"], 1) if self._driver.pooled else 1
+        
+        opened = await asyncio.gather(
+            *(self.engine.connect() for _ in range(count)),
+            return_exceptions=True
+        )
+        
+        # Closing hands each connection back to the pool, ready for reuse
+        for conn in opened:
+            if not isinstance(conn, Exception):
+                await conn.close()
+        
+        errors = [conn for conn in opened if isinstance(conn, Exception)]
+        if errors:
+            # Drop the connections that did open so a retry starts from a fresh engine
+            await self.engine.dispose()
+            self.engine = None
+            raise errors[0]
+    
     async def disconnect(self) -> None:
         """Close database connection."""
+        if self._insert_buffer is not None:
+            # Write buffered rows while the engine is still open
+            await self._insert_buffer.close()
+            self._insert_buffer = None
+        
         if self.engine:
             await self.engine.dispose()
             self.engine = None
@@ -142,174 +495,357 @@ class SQLDatabaseTool(BaseDatabaseTool):
         Returns:
             Tuple of (rows as list of dicts, column names)
         """
-        if not self._is_connected or not self.engine:
-            await self.connect()
+        await self._ensure_connected()
         
         try:
-            async with self.engine.begin() as conn:
-                # Set query timeout if supported
-                if self.database_type == 'postgresql':
-                    await conn.execute(text(f"SET statement_timeout = {timeout * 1000}"))
-                elif self.database_type == 'mysql':
-                    await conn.execute(text(f"SET SESSION max_execution_time = {timeout * 1000}"))
-                
+            async with self._read_connection(timeout) as conn:
                 # Execute query
-                result = await conn.execute(text(query))
-                
-                # Fetch results
-                rows = result.fetchall()
-                columns = list(result.keys()) if rows else []
+                result = await conn.execute(_compile(query))
                 
-                # Convert to list of dicts
-                rows_as_dicts = [dict(row._mapping) for row in rows]
+                # Rows are tuples; zipping them with the keys builds each dict in C
+                # instead of going through the per-row RowMapping proxy
+                keys = list(result.keys())
+                rows_as_dicts = [dict(zip(keys, row)) for row in result]
+                columns = keys if rows_as_dicts else []
                 
                 return rows_as_dicts, columns
                 
         except Exception as e:
             raise DatabaseQueryError(f"Query execution failed: {str(e)}")
     
-    async def get_schema_info(self) -> Dict[str, Any]:
-        """Get database schema information."""
-        if not self._is_connected or not self.engine:
-            await self.connect()
+    async def execute_query_arrow(self, query: str, timeout: int = 30) -> "pa.Table":
+        """
+        Execute SQL query and return the result as an Arrow table.
+        Rows are transposed once and each column is built as a typed Arrow
+        array, so numeric-heavy results skip per-row dict construction; call
+        to_pylist() on the table where JSON rows are needed.
+        
+        Args:
+            query: SQL query to execute
+            timeout: Query timeout in seconds
+            
+        Returns:
+            pyarrow.Table with the query results
+        """
+        if not PYARROW_AVAILABLE:
+            raise DatabaseQueryError("pyarrow is required for Arrow results")
+        
+        await self._ensure_connected()
+        
+        try:
+            async with self._read_connection(timeout) as conn:
+                result = await conn.execute(_compile(query))
+                keys = list(result.keys())
+                rows = result.fetchall()
+            
+            columns = zip(*rows) if rows else ([] for _ in keys)
+            return pa.Table.from_arrays([pa.array(list(column)) for column in columns], names=keys)
+                
+        except Exception as e:
+            raise DatabaseQueryError(f"Query execution failed: {str(e)}")
+    
+    async def stream_query(self, query: str, timeout: int = 30,
+                           batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute SQL query through a server-side cursor and yield rows.
+        
+        Args:
+            query: SQL query to execute
+            timeout: Query timeout in seconds
+            batch_size: Rows fetched from the server per round-trip
+            
+        Yields:
+            Rows as dicts
+        """
+        async for batch in self.stream_batches(query, timeout, batch_size):
+            for row in batch:
+                yield row
+    
+    async def stream_batches(self, query: str, timeout: int = 30,
+                             batch_size: int = 1000) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Execute SQL query through a server-side cursor and yield rows in batches.
+        Only one batch is held in memory at a time, so callers can stop early
+        or write each batch out before the next is fetched.
+        
+        Args:
+            query: SQL query to execute
+            timeout: Query timeout in seconds
+            batch_size: Rows per batch and per server round-trip
+            
+        Yields:
+            Lists of up to batch_size rows as dicts
+        """
+        await self._ensure_connected()
+        
+        try:
+            # Server-side cursors need a transaction on PostgreSQL
+            async with self._read_connection(timeout, transaction=True) as conn:
+                result = await conn.stream(
+                    _compile(query), execution_options={"yield_per": batch_size}
+                )
+                keys = list(result.keys())
+                async for partition in result.partitions(batch_size):
+                    yield [dict(zip(keys, row)) for row in partition]
+                
+        except Exception as e:
+            raise DatabaseQueryError(f"Query execution failed: {str(e)}")
+    
+    async def bulk_insert(self, table_name: str, columns: List[str],
+                          rows: Iterable[Sequence[Any]], batch_size: int = 10000) -> int:
+        """
+        Insert many rows in batches instead of one statement per row.
+        
+        PostgreSQL uses COPY via asyncpg's copy_records_to_table; MySQL and
+        SQLite use executemany, which aiomysql rewrites into multi-row VALUES.
+        All batches run in one transaction.
+        
+        Args:
+            table_name: Target table, optionally schema-qualified
+            columns: Column names matching the order of values in each row
+            rows: Row value sequences
+            batch_size: Rows sent per round trip
+            
+        Returns:
+            Number of rows inserted
+        """
+        await self._ensure_connected()
+        
+        schema_name, _, table = table_name.rpartition('.')
+        rows = iter(rows)
+        inserted = 0
+        
+        try:
+            async with self.engine.begin() as conn:
+                if self._driver.copy_records:
+                    raw = (await conn.get_raw_connection()).driver_connection
+                    # SQLAlchemy only sends BEGIN with its first statement, and COPY
+                    # bypasses it; without this each batch would commit on its own
+                    async with raw.transaction():
+                        while chunk := list(itertools.islice(rows, batch_size)):
+                            await raw.copy_records_to_table(
+                                table, records=chunk, columns=columns,
+                                schema_name=schema_name or None
+                            )
+                            inserted += len(chunk)
+                    return inserted
+                
+                quote = self.engine.dialect.identifier_preparer.quote
+                target = ".".join(quote(part) for part in table_name.split('.'))
+                statement = text(
+                    f"INSERT INTO {target} ({', '.join(quote(c) for c in columns)}) "
+                    f"VALUES ({', '.join(f':p{i}' for i in range(len(columns)))})"
+                )
+                keys = [f"p{i}" for i in range(len(columns))]
+                
+                while chunk := list(itertools.islice(rows, batch_size)):
+                    await conn.execute(statement, [dict(zip(keys, row)) for row in chunk])
+                    inserted += len(chunk)
+                
+                return inserted
+                
+        except Exception as e:
+            raise DatabaseQueryError(f"Bulk insert into {table_name} failed: {str(e)}")
+    
+    def insert_async(self, table_name: str, columns: List[str], row: Sequence[Any]) -> None:
+        """
+        Queue a single-row insert to be written with other rows in one batch.
+        
+        Rows are written through bulk_insert within insert_buffer_ms (or as soon
+        as insert_buffer_rows are pending for the table). Failed batches are
+        logged rather than raised, since the caller has already moved on.
+        
+        Args:
+            table_name: Target table, optionally schema-qualified
+            columns: Column names matching the order of values in row
+            row: Row values
+        """
+        if self._insert_buffer is None:
+            params = self.connection_params
+            self._insert_buffer = AsyncInsertBuffer(
+                self.bulk_insert,
+                max_rows=int(params.get('insert_buffer_rows', 100000)),
+                max_wait_ms=int(params.get('insert_buffer_ms', 200))
+            )
+        
+        self._insert_buffer.enqueue(table_name, columns, row)
+    
+    @asynccontextmanager
+    async def _read_connection(self, timeout: int, transaction: bool = False) -> AsyncIterator[Any]:
+        """
+        Borrow a pooled connection for a read.
+        
+        Connections already carry the configured statement_timeout, so the
+        common case runs the query alone in autocommit mode: no BEGIN, SET or
+        COMMIT round trips. Other timeouts are set for this use only.
+        
+        Args:
+            timeout: Query timeout in seconds
+            transaction: Run inside a transaction even when not needed for the timeout
+            
+        Yields:
+            An AsyncConnection
+        """
+        timeout_sql = self._driver.timeout_sql
+        custom_timeout = timeout != self._statement_timeout and timeout_sql is not None
+        
+        if not custom_timeout and not transaction:
+            async with self.engine.connect() as conn:
+                yield await conn.execution_options(isolation_level="AUTOCOMMIT")
+            return
+        
+        async with self.engine.begin() as conn:
+            if not custom_timeout:
+                yield conn
+            elif self._driver.timeout_is_local:
+                await conn.execute(text(timeout_sql.format(ms=timeout * 1000)))
+                yield conn
+            else:
+                # Session-scoped; restore before the connection is reused
+                await conn.execute(text(timeout_sql.format(ms=timeout * 1000)))
+                try:
+                    yield conn
+                finally:
+                    await conn.execute(text(timeout_sql.format(ms=self._statement_timeout * 1000)))
+    
+    async def get_schema_info(self, level: int = 2) -> Dict[str, Any]:
+        """
+        Get database schema information.
+        
+        Args:
+            level: 1 for schema names only, 2 to add tables and views,
+                3 to also add each table's columns and row count
+        """
+        await self._ensure_connected()
         
         try:
             schema_info = {
                 "database_type": self.database_type,
-                "schemas": [],
-                "tables": {},
-                "views": {}
+                "schemas": []
             }
             
-            async with self.engine.begin() as conn:
-                # Get schemas/databases
-                if self.database_type == 'postgresql':
-                    result = await conn.execute(text("""
-                        SELECT schema_name 
-                        FROM information_schema.schemata 
-                        WHERE schema_name NOT IN ('information_schema', 'pg_catalog', 'pg_toast')
-                    """))
-                    schema_info["schemas"] = [row[0] for row in result.fetchall()]
-                    
-                    # Get tables and views
-                    result = await conn.execute(text("""
-                        SELECT table_schema, table_name, table_type
-                        FROM information_schema.tables
-                        WHERE table_schema NOT IN ('information_schema', 'pg_catalog')
-                        ORDER BY table_schema, table_name
-                    """))
-                    
-                elif self.database_type == 'mysql':
-                    result = await conn.execute(text("SHOW DATABASES"))
-                    schema_info["schemas"] = [row[0] for row in result.fetchall()]
-                    
-                    # Get tables and views
-                    result = await conn.execute(text("""
-                        SELECT table_schema, table_name, table_type
-                        FROM information_schema.tables
-                        WHERE table_schema NOT IN ('information_schema', 'mysql', 'performance_schema', 'sys')
-                        ORDER BY table_schema, table_name
-                    """))
-                    
-                elif self.database_type == 'sqlite':
-                    # SQLite doesn't have schemas, just tables
-                    result = await conn.execute(text("""
-                        SELECT name, type 
-                        FROM sqlite_master 
-                        WHERE type IN ('table', 'view')
-                        ORDER BY name
-                    """))
-                    
-                    for row in result.fetchall():
-                        table_name, table_type = row
-                        if table_type == 'table':
-                            schema_info["tables"][table_name] = {"schema": "main"}
-                        else:
-                            schema_info["views"][table_name] = {"schema": "main"}
-                    
+            metadata_sql = self._driver.metadata
+            
+            if not self._driver.has_schemas:
+                # SQLite doesn't have schemas, just tables
+                if level < 2:
                     return schema_info
                 
-                # Process tables and views for PostgreSQL/MySQL
-                for row in result.fetchall():
-                    schema_name, table_name, table_type = row
-                    table_type = table_type.upper()
-                    
-                    if table_type in ('BASE TABLE', 'TABLE'):
-                        if schema_name not in schema_info["tables"]:
-                            schema_info["tables"][schema_name] = []
-                        schema_info["tables"][schema_name].append(table_name)
-                    elif table_type == 'VIEW':
-                        if schema_name not in schema_info["views"]:
-                            schema_info["views"][schema_name] = []
-                        schema_info["views"][schema_name].append(table_name)
+                schema_info.update(tables={}, views={})
+                rows = await self._fetch_rows(metadata_sql['objects'])
+                
+                for table_name, table_type in rows:
+                    if table_type == 'table':
+                        schema_info["tables"][table_name] = {"schema": "main"}
+                    else:
+                        schema_info["views"][table_name] = {"schema": "main"}
                 
+                if level >= 3:
+                    schema_info["table_info"] = await self._describe_tables(
+                        [(None, table_name) for table_name in schema_info["tables"]]
+                    )
+                return schema_info
+            
+            # Get schemas/databases and tables/views
+            if level < 2:
+                schema_rows = await self._fetch_rows(metadata_sql['schemas'])
+                schema_info["schemas"] = [row[0] for row in schema_rows]
                 return schema_info
+            
+            # The two lookups are independent, so run them on separate pooled connections
+            schema_rows, table_rows = await asyncio.gather(
+                self._fetch_rows(metadata_sql['schemas']),
+                self._fetch_rows(metadata_sql['tables'])
+            )
+            schema_info["schemas"] = [row[0] for row in schema_rows]
+            schema_info.update(tables={}, views={})
+            
+            # Process tables and views for PostgreSQL/MySQL
+            for schema_name, table_name, table_type in table_rows:
+                table_type = table_type.upper()
+                
+                if table_type in ('BASE TABLE', 'TABLE'):
+                    if schema_name not in schema_info["tables"]:
+                        schema_info["tables"][schema_name] = []
+                    schema_info["tables"][schema_name].append(table_name)
+                elif table_type == 'VIEW':
+                    if schema_name not in schema_info["views"]:
+                        schema_info["views"][schema_name] = []
+                    schema_info["views"][schema_name].append(table_name)
+            
+            if level >= 3:
+                schema_info["table_info"] = await self._describe_tables(
+                    [(schema_name, table_name)
+                     for schema_name, table_names in schema_info["tables"].items()
+                     for table_name in table_names]
+                )
+            
+            return schema_info
                 
         except Exception as e:
             raise DatabaseQueryError(f"Failed to retrieve schema info: {str(e)}")
     
+    def pool_status(self) -> Dict[str, Any]:
+        """Report pool sizing plus live checkout counts from the engine pool."""
+        status = super().pool_status()
+        
+        pool = self.engine.pool if self.engine else None
+        if pool is not None and hasattr(pool, 'checkedout'):
+            status.update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow()
+            })
+        
+        return status
+    
+    async def _fetch_rows(self, sql: str) -> List[Tuple]:
+        """Run a metadata query on its own pooled connection."""
+        async with self.engine.connect() as conn:
+            result = await conn.execute(_compile(sql))
+            return result.fetchall()
+    
     def _build_connection_string(self) -> str:
         """Build database connection string."""
         params = self.connection_params
-        db_type = self.database_type
-        
-        if db_type == 'postgresql':
-            host = params.get('host', 'localhost')
-            port = params.get('port', 5432)
-            database = params['database']
-            username = params.get('username', 'postgres')
-            password = params.get('password', '')
-            
-            # URL encode password to handle special characters
-            encoded_password = quote_plus(password) if password else ''
-            auth = f"{username}:{encoded_password}@" if username else ""
-            
-            return f"postgresql+asyncpg://{auth}{host}:{port}/{database}"
-            
-        elif db_type == 'mysql':
-            host = params.get('host', 'localhost')
-            port = params.get('port', 3306)
-            database = params['database']
-            username = params.get('username', 'root')
-            password = params.get('password', '')
-            
-            # URL encode password to handle special characters
-            encoded_password = quote_plus(password) if password else ''
-            auth = f"{username}:{encoded_password}@" if username else ""
-            
-            return f"mysql+aiomysql://{auth}{host}:{port}/{database}"
-            
-        elif db_type == 'sqlite':
+        driver = self._driver
+        
+        if not driver.has_schemas:
             database_path = params['database']
-            return f"sqlite+aiosqlite:///{database_path}"
-            
-        else:
-            raise ValueError(f"Unsupported database type: {db_type}")
+            return f"{driver.url_scheme}:///{database_path}"
+        
+        host = params.get('host', 'localhost')
+        port = params.get('port', driver.default_port)
+        database = params['database']
+        username = params.get('username', driver.default_username)
+        password = params.get('password', '')
+        
+        # URL encode password to handle special characters
+        encoded_password = quote_plus(password) if password else ''
+        auth = f"{username}:{encoded_password}@" if username else ""
+        
+        return f"{driver.url_scheme}://{auth}{host}:{port}/{database}"
+    
+    def _get_pool_args(self) -> Dict[str, Any]:
+        """Get engine pool sizing arguments."""
+        if not self._driver.pooled:
+            return {}
+        
+        pool = self.pool_config
+        return {
+            "pool_size": pool["max_size"],
+            "max_overflow": 0,
+            "pool_timeout": pool["pool_timeout"],
+            "pool_recycle": int(self.connection_params.get('pool_recycle', 3600)),
+            # SQLAlchemy pings with the driver's native check (an empty statement
+            # on asyncpg, COM_PING on aiomysql) rather than a parsed SELECT 1
+            "pool_pre_ping": bool(self.connection_params.get('pool_pre_ping', True))
+        }
     
     def _get_connect_args(self) -> Dict[str, Any]:
         """Get database-specific connection arguments."""
-        params = self.connection_params
-        connect_args = {}
-        
-        if self.database_type == 'postgresql':
-            if params.get('ssl_mode'):
-                connect_args['sslmode'] = params['ssl_mode']
-            if params.get('connection_timeout'):
-                connect_args['command_timeout'] = params['connection_timeout']
-                
-        elif self.database_type == 'mysql':
-            if params.get('connection_timeout'):
-                connect_args['connect_timeout'] = params['connection_timeout']
-            if params.get('charset'):
-                connect_args['charset'] = params['charset']
-            else:
-                connect_args['charset'] = 'utf8mb4'
-                
-        elif self.database_type == 'sqlite':
-            if params.get('connection_timeout'):
-                connect_args['timeout'] = params['connection_timeout']
-        
-        return connect_args
+        return self._driver.connect_args(self.connection_params, self._statement_timeout)
     
     async def get_table_info(self, table_name: str, schema_name: str = None) -> Dict[str, Any]:
         """
@@ -322,8 +858,14 @@ class SQLDatabaseTool(BaseDatabaseTool):
         Returns:
             Dict with table information including columns, types, etc.
         """
-        if not self._is_connected or not self.engine:
-            await self.connect()
+        return await self._cached_metadata(
+            f"table:{schema_name}.{table_name}",
+            lambda: self._load_table_info(table_name, schema_name)
+        )
+    
+    async def _load_table_info(self, table_name: str, schema_name: str = None) -> Dict[str, Any]:
+        """Fetch a table's columns and approximate row count."""
+        await self._ensure_connected()
         
         try:
             table_info = {
@@ -333,60 +875,31 @@ class SQLDatabaseTool(BaseDatabaseTool):
                 "row_count": None
             }
             
-            async with self.engine.begin() as conn:
+            async with self._read_connection(self._statement_timeout) as conn:
                 # Get column information
-                if self.database_type == 'postgresql':
-                    schema_filter = f"AND table_schema = '{schema_name}'" if schema_name else ""
-                    query = f"""
-                        SELECT column_name, data_type, is_nullable, column_default
-                        FROM information_schema.columns
-                        WHERE table_name = '{table_name}' {schema_filter}
-                        ORDER BY ordinal_position
-                    """
-                    
-                elif self.database_type == 'mysql':
-                    schema_filter = f"AND table_schema = '{schema_name}'" if schema_name else ""
-                    query = f"""
-                        SELECT column_name, data_type, is_nullable, column_default
-                        FROM information_schema.columns
-                        WHERE table_name = '{table_name}' {schema_filter}
-                        ORDER BY ordinal_position
-                    """
-                    
-                elif self.database_type == 'sqlite':
-                    query = f"PRAGMA table_info({table_name})"
+                metadata_sql = self._driver.metadata
+                if schema_name and self._driver.has_schemas:
+                    query = metadata_sql['columns_in_schema']
+                else:
+                    query = metadata_sql['columns']
                 
-                result = await conn.execute(text(query))
+                result = await conn.execute(
+                    _compile(query), {"table": table_name, "schema": schema_name}
+                )
                 
-                if self.database_type == 'sqlite':
-                    # SQLite PRAGMA returns different format
-                    for row in result.fetchall():
-                        table_info["columns"].append({
-                            "name": row[1],
-                            "type": row[2],
-                            "nullable": not bool(row[3]),
-                            "default": row[4]
-                        })
-                else:
-                    # PostgreSQL/MySQL format
-                    for row in result.fetchall():
-                        table_info["columns"].append({
-                            "name": row[0],
-                            "type": row[1],
-                            "nullable": row[2] == 'YES',
-                            "default": row[3]
-                        })
+                # Every driver's columns query has the information_schema shape
+                for row in result.fetchall():
+                    table_info["columns"].append({
+                        "name": row[0],
+                        "type": row[1],
+                        "nullable": row[2] == 'YES',
+                        "default": row[3]
+                    })
                 
-                # Get row count (approximate for large tables)
+                # Get row count (approximate except on SQLite)
                 try:
-                    if schema_name and self.database_type != 'sqlite':
-                        full_table_name = f"{schema_name}.{table_name}"
-                    else:
-                        full_table_name = table_name
-                    
-                    count_result = await conn.execute(text(f"SELECT COUNT(*) FROM {full_table_name}"))
-                    table_info["row_count"] = count_result.fetchone()[0]
-                except:
+                    table_info["row_count"] = await self._row_count(conn, table_name, schema_name)
+                except Exception:
                     # If count fails (permissions, etc.), leave as None
                     pass
                 
@@ -394,11 +907,41 @@ class SQLDatabaseTool(BaseDatabaseTool):
                 
         except Exception as e:
             raise DatabaseQueryError(f"Failed to get table info: {str(e)}")
+    
+    async def _row_count(self, conn, table_name: str, schema_name: Optional[str]) -> Optional[int]:
+        """
+        Row count for a table without scanning it where the engine keeps statistics.
+        
+        PostgreSQL reads the planner estimate from pg_class and MySQL the
+        information_schema estimate; SQLite files are small enough to count.
+        
+        Returns:
+            Row count, or None if the engine has no estimate yet
+        """
+        row_estimate = self._driver.metadata.get('row_estimate')
+        
+        if row_estimate is not None:
+            result = await conn.execute(
+                _compile(row_estimate), {"schema": schema_name, "table": table_name}
+            )
+        else:
+            if not _IDENTIFIER_RE.fullmatch(table_name):
+                raise DatabaseQueryError(f"Invalid identifier: {table_name}")
+            quote = self.engine.dialect.identifier_preparer.quote
+            result = await conn.execute(_compile(f"SELECT COUNT(*) FROM {quote(table_name)}"))
+        
+        row = result.fetchone()
+        # reltuples is -1 for tables never analyzed
+        if row is None or row[0] is None or row[0] < 0:
+            return None
+        return int(row[0])
 
 
 class PostgreSQLTool(SQLDatabaseTool):
     """Specialized PostgreSQL database tool."""
     
+    __slots__ = ()
+    
     def __init__(self, connection_params: Dict[str, Any]):
         connection_params['database_type'] = 'postgresql'
         super().__init__(connection_params)
@@ -407,6 +950,8 @@ class PostgreSQLTool(SQLDatabaseTool):
 class MySQLTool(SQLDatabaseTool):
     """Specialized MySQL database tool."""
     
+    __slots__ = ()
+    
     def __init__(self, connection_params: Dict[str, Any]):
         connection_params['database_type'] = 'mysql'
         super().__init__(connection_params)
@@ -415,6 +960,8 @@ class MySQLTool(SQLDatabaseTool):
 class SQLiteTool(SQLDatabaseTool):
     """Specialized SQLite database tool."""
     
+    __slots__ = ()
+    
     def __init__(self, connection_params: Dict[str, Any]):
         connection_params['database_type'] = 'sqlite'
         super().__init__(connection_params)
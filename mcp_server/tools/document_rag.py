@@ -1,7 +1,11 @@
 import aiohttp
+import asyncio
+import hashlib
+import orjson
 from typing import Dict, Any, Optional, List
 
 from ..config import settings
+from ..utils.cache import TTLCache
 from .base import BaseTool
 
 class DocumentRAGTool(BaseTool):
@@ -9,6 +13,10 @@ class DocumentRAGTool(BaseTool):
     Tool for querying a RAG system to retrieve and generate responses from documents.
     """
     
+    # Successful answers are reused for identical queries for this long
+    RESPONSE_CACHE_TTL = 600
+    RESPONSE_CACHE_SIZE = 1024
+    
     def __init__(self):
         super().__init__(
             name="document_search",
@@ -16,6 +24,45 @@ class DocumentRAGTool(BaseTool):
         )
         self.rag_endpoint = settings.TOOL_CONFIGS.get("document_rag", {}).get("endpoint", "http://localhost:7000")
         self.api_key = settings.TOOL_CONFIGS.get("document_rag", {}).get("api_key", "")
+        self._session: Optional[aiohttp.ClientSession] = None
+        # (collection, max_results, query digest) -> response
+        self._responses = TTLCache(self.RESPONSE_CACHE_SIZE, self.RESPONSE_CACHE_TTL)
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+        
+        Returns:
+            aiohttp.ClientSession reused across queries
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30),
+                headers={
+                    "Content-Type": "application/json",
+                    **({"Authorization": f"Bearer {self.api_key}"} if self.api_key else {})
+                }
+            )
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+    
+    def invalidate(self, collection: str = None) -> None:
+        """
+        Drop cached responses, e.g. after documents were re-indexed.
+        
+        Args:
+            collection: Only drop responses for this collection (all if omitted)
+        """
+        if collection is None:
+            self._responses.invalidate()
+        else:
+            self._responses.invalidate(lambda key: key[0] == collection)
     
     @property
     def parameters(self) -> Dict[str, Any]:
@@ -54,11 +101,14 @@ class DocumentRAGTool(BaseTool):
             Dict with RAG response and source documents
         """
         
+        cache_key = (collection, max_results,
+                     hashlib.blake2b(query.encode(), digest_size=16).hexdigest())
+        cached = self._responses.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         # Example RAG API call (adjust for your RAG system)
         url = f"{self.rag_endpoint}/api/query"
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
         
         payload = {
             "query": query,
@@ -68,25 +118,51 @@ class DocumentRAGTool(BaseTool):
         }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload, headers=headers) as response:
-                    if response.status != 200:
-                        # Fallback response if RAG system unavailable
-                        return self._fallback_response(query)
-                    
-                    data = await response.json()
-                    
-                    return {
-                        "query": query,
-                        "answer": data.get("answer", "No answer found"),
-                        "sources": data.get("sources", []),
-                        "confidence": data.get("confidence", 0.0),
-                        "collection": collection
-                    }
-                    
+            # Pooled keep-alive connection; JSON and auth headers are set on the session
+            async with self._get_session().post(url, data=orjson.dumps(payload)) as response:
+                if response.status != 200:
+                    # Fallback response if RAG system unavailable
+                    return self._fallback_response(query)
+                
+                data = orjson.loads(await response.read())
+                
+                result = {
+                    "query": query,
+                    "answer": data.get("answer", "No answer found"),
+                    "sources": data.get("sources", []),
+                    "confidence": data.get("confidence", 0.0),
+                    "collection": collection
+                }
+                # Only real answers are cached; fallbacks are retried next time
+                self._responses.set(cache_key, result)
+                return dict(result)
+                
         except Exception as e:
             return self._fallback_response(query, error=str(e))
     
+    async def execute_many(self, requests: List[Dict[str, Any]],
+                           concurrency: int = 16) -> List[Dict[str, Any]]:
+        """
+        Run several RAG queries (e.g. one per collection) concurrently.
+        
+        Requests share the pooled HTTP session and the response cache; at most
+        `concurrency` are in flight at once.
+        
+        Args:
+            requests: Keyword arguments for execute(), one dict per query
+            concurrency: Maximum simultaneous requests to the RAG endpoint
+            
+        Returns:
+            Responses in the same order as requests
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _one(request: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.execute(**request)
+        
+        return await asyncio.gather(*(_one(request) for request in requests))
+    
     def _fallback_response(self, query: str, error: str = None) -> Dict[str, Any]:
         """Fallback when RAG system is unavailable."""
         return {
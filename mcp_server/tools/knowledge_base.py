@@ -1,14 +1,50 @@
 import aiohttp
-from typing import Dict, Any, Optional, List
+import hashlib
+import numpy as np
+from typing import Dict, Any, Optional, List, Tuple
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
 
 from ..config import settings
+from ..utils.cache import TTLCache
 from .base import BaseTool
 
+# Mock knowledge base for demonstration
+# Replace with actual RAG system integration
+_MOCK_KB: Dict[str, Dict[str, str]] = {
+    "technical": {
+        "How do I deploy the application?": "Use Docker: `docker build -t app . && docker run -p 8000:8000 app`",
+        "What's the API rate limit?": "100 requests per minute for authenticated users, 10 for anonymous users.",
+        "How to setup OAuth?": "Configure OAuth in settings.py with your provider credentials."
+    },
+    "policy": {
+        "What's the vacation policy?": "Employees get 15 days PTO annually, plus company holidays.",
+        "Remote work policy?": "Hybrid work allowed 3 days remote per week with manager approval.",
+        "Expense reimbursement?": "Submit expenses via portal within 30 days with receipts."
+    },
+    "faq": {
+        "How to reset password?": "Click 'Forgot Password' on login page or contact IT support.",
+        "Who to contact for support?": "Technical: tech@company.com, HR: hr@company.com, General: support@company.com",
+        "Office hours?": "Monday-Friday 9AM-6PM EST, lunch break 12-1PM."
+    }
+}
+
 class KnowledgeBaseTool(BaseTool):
     """
     Tool for querying a specialized knowledge base using RAG.
     """
     
+    # Answers are reused for identical questions for this long
+    RESPONSE_CACHE_TTL = 600
+    RESPONSE_CACHE_SIZE = 1024
+    
+    # Minimum RapidFuzz token_set_ratio (0-100) for the typo-tolerant fallback
+    FUZZY_SCORE_CUTOFF = 80
+    
     def __init__(self):
         super().__init__(
             name="knowledge_search",
@@ -16,6 +52,48 @@ class KnowledgeBaseTool(BaseTool):
         )
         self.kb_endpoint = settings.TOOL_CONFIGS.get("knowledge_base", {}).get("endpoint", "http://localhost:8000")
         self.api_key = settings.TOOL_CONFIGS.get("knowledge_base", {}).get("api_key", "")
+        # (category, question digest) -> response
+        self._responses = TTLCache(self.RESPONSE_CACHE_SIZE, self.RESPONSE_CACHE_TTL)
+        # category -> word index over its questions, built once
+        self._index = {category: self._build_index(entries) for category, entries in _MOCK_KB.items()}
+        # category -> stored questions for fuzzy matching
+        self._questions = {category: tuple(entries) for category, entries in _MOCK_KB.items()}
+    
+    @staticmethod
+    def _build_index(entries: Dict[str, str]) -> Tuple[Dict[str, int], np.ndarray, np.ndarray, List[Tuple[str, str]]]:
+        """
+        Index a category's questions for keyword scoring.
+        
+        Args:
+            entries: Question -> answer mapping
+            
+        Returns:
+            Tuple of (word -> column, question x word 0/1 matrix,
+            question word counts, (question, answer) pairs in row order)
+        """
+        items = list(entries.items())
+        tokens = [set(kb_question.lower().split()) for kb_question, _ in items]
+        vocabulary = {word: i for i, word in enumerate(sorted(set().union(*tokens)))}
+        
+        matrix = np.zeros((len(items), len(vocabulary)), dtype=np.float32)
+        for row, words in enumerate(tokens):
+            matrix[row, [vocabulary[word] for word in words]] = 1
+        
+        lengths = np.fromiter((len(kb_question.split()) for kb_question, _ in items),
+                              dtype=np.float32, count=len(items))
+        return vocabulary, matrix, lengths, items
+    
+    def invalidate(self, category: str = None) -> None:
+        """
+        Drop cached responses, e.g. after the knowledge base changed.
+        
+        Args:
+            category: Only drop responses for this category (all if omitted)
+        """
+        if category is None:
+            self._responses.invalidate()
+        else:
+            self._responses.invalidate(lambda key: key[0] == category)
     
     @property
     def parameters(self) -> Dict[str, Any]:
@@ -48,40 +126,45 @@ class KnowledgeBaseTool(BaseTool):
         Returns:
             Dict with knowledge base response
         """
+        cache_key = (category, hashlib.blake2b(question.encode(), digest_size=16).hexdigest())
+        cached = self._responses.get(cache_key)
+        if cached is not None:
+            return dict(cached)
         
-        # Mock knowledge base for demonstration
-        # Replace with actual RAG system integration
-        mock_kb = {
-            "technical": {
-                "How do I deploy the application?": "Use Docker: `docker build -t app . && docker run -p 8000:8000 app`",
-                "What's the API rate limit?": "100 requests per minute for authenticated users, 10 for anonymous users.",
-                "How to setup OAuth?": "Configure OAuth in settings.py with your provider credentials."
-            },
-            "policy": {
-                "What's the vacation policy?": "Employees get 15 days PTO annually, plus company holidays.",
-                "Remote work policy?": "Hybrid work allowed 3 days remote per week with manager approval.",
-                "Expense reimbursement?": "Submit expenses via portal within 30 days with receipts."
-            },
-            "faq": {
-                "How to reset password?": "Click 'Forgot Password' on login page or contact IT support.",
-                "Who to contact for support?": "Technical: tech@company.com, HR: hr@company.com, General: support@company.com",
-                "Office hours?": "Monday-Friday 9AM-6PM EST, lunch break 12-1PM."
-            }
-        }
-        
+        result = self._search(question, category)
+        self._responses.set(cache_key, result)
+        return dict(result)
+    
+    def _search(self, question: str, category: str) -> Dict[str, Any]:
+        """Find the best-matching answer for a question within a category."""
         # Simple keyword matching (replace with actual RAG search)
-        category_kb = mock_kb.get(category, {})
+        index = self._index.get(category)
         best_match = None
         best_score = 0.0
         
-        for kb_question, answer in category_kb.items():
-            # Simple similarity (replace with proper vector search)
-            words_overlap = len(set(question.lower().split()) & set(kb_question.lower().split()))
-            score = words_overlap / max(len(question.split()), len(kb_question.split()))
+        if index is not None:
+            vocabulary, matrix, lengths, entries = index
+            # The question is tokenized once; stored questions were tokenized at init
+            words = question.lower().split()
+            columns = [vocabulary[word] for word in frozenset(words) if word in vocabulary]
+            # Overlap with every stored question in one matrix pass
+            scores = matrix[:, columns].sum(axis=1) / np.maximum(len(words), lengths)
             
-            if score > best_score:
-                best_score = score
-                best_match = (kb_question, answer)
+            best = int(scores.argmax())
+            if scores[best] > 0:
+                best_score = float(scores[best])
+                best_match = entries[best]
+        
+        if best_score <= 0.2 and RAPIDFUZZ_AVAILABLE and category in self._questions:
+            # No exact word overlap to speak of; try a typo-tolerant match in C++
+            match = process.extractOne(
+                question, self._questions[category], scorer=fuzz.token_set_ratio,
+                processor=str.lower, score_cutoff=self.FUZZY_SCORE_CUTOFF
+            )
+            if match is not None:
+                matched_question, score, _ = match
+                best_score = score / 100
+                best_match = (matched_question, _MOCK_KB[category][matched_question])
         
         if best_match and best_score > 0.2:  # Threshold for relevance
             return {
@@ -1,5 +1,6 @@
 """Utility functions and helpers."""
 
 from .auth import verify_token, create_token, decode_token
+from .cache import TTLCache
 
-__all__ = ["verify_token", "create_token", "decode_token"]
\ No newline at end of file
+__all__ = ["verify_token", "create_token", "decode_token", "TTLCache"]
\ No newline at end of file
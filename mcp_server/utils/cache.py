@@ -0,0 +1,73 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache whose entries also expire after a fixed TTL.
+    
+    Not thread-safe; meant for use from a single event loop.
+    """
+    
+    __slots__ = ('_entries', '_ttl', '_maxsize')
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 600):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries before the least recently used is dropped
+            ttl: Seconds an entry stays valid (0 disables caching)
+        """
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._ttl = ttl
+        self._maxsize = maxsize
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a live entry.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return entry[1]
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if self._ttl <= 0:
+            return
+        
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, predicate: Callable[[Hashable], bool] = None) -> None:
+        """
+        Drop entries, e.g. after the underlying data changed.
+        
+        Args:
+            predicate: Only drop keys for which this returns True (all if omitted)
+        """
+        if predicate is None:
+            self._entries.clear()
+            return
+        
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+    
+    def __len__(self) -> int:
+        return len(self._entries)